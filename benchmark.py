@@ -0,0 +1,271 @@
+"""Benchmarks the scoreboard's data and render paths on the virtual matrix.
+
+Every stage runs against fixture payloads (cache/teams.json and bench/fixtures/scoreboard.json) with no network and
+no LED hardware. Render stages report latency percentiles per call, animations report the interval between frames
+reaching the panel and frames/sec. Each stage is then rerun under tracemalloc to report allocations.
+
+Results are compared with a saved baseline so regressions show up before a Pi is flashed. Run from the scoreboard
+directory:
+    python benchmark.py             Run and compare against bench/baseline.json.
+    python benchmark.py --save      Run and save the results as the new baseline.
+    python benchmark.py --record    Save today's scoreboard JSON from ESPN as the fixture.
+"""
+from datetime import datetime
+import argparse
+import configparser
+import copy
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import PIL
+import scoreboard
+
+BASELINE = "bench/baseline.json"
+FIXTURE = "bench/fixtures/scoreboard.json"
+SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard"
+
+class fixtureClient:
+    """Stands in for the ESPN httpClient, answering every pull with the next fixture payload in turn."""
+    def __init__(self, payloads):
+        self.payloads=payloads
+        self.pulls=0
+
+    def getJson(self, url, conditional=True):
+        payload=self.payloads[self.pulls % len(self.payloads)]
+        self.pulls+=1
+        return payload
+
+def percentile(samples, percent):
+    """Nearest rank percentile of a list of samples."""
+    ordered=sorted(samples)
+    rank=max(int(round(percent/100*len(ordered)+0.5))-1, 0)
+    return ordered[min(rank, len(ordered)-1)]
+
+def summarize(samples):
+    """Latency percentiles in milliseconds from a list of durations in seconds."""
+    return {
+        'count': len(samples),
+        'mean': round(1000*sum(samples)/len(samples), 4),
+        'p50': round(1000*percentile(samples, 50), 4),
+        'p90': round(1000*percentile(samples, 90), 4),
+        'p99': round(1000*percentile(samples, 99), 4),
+        'max': round(1000*max(samples), 4)
+    }
+
+def timeCalls(call, iterations):
+    """Times each of a number of calls. Returns the durations in seconds."""
+    samples=[]
+    for iteration in range(iterations):
+        start=time.perf_counter()
+        call(iteration)
+        samples.append(time.perf_counter()-start)
+    return samples
+
+def timeFrames(call):
+    """Runs an animation once. Returns the intervals between frames reaching the panel, the frame count and the wall time."""
+    matrix=scoreboard.matrix
+    matrix.frames.clear()
+    start=time.perf_counter()
+    call(0)
+    wall=time.perf_counter()-start
+    stamps=[frame.timestamp for frame in matrix.frames]
+    intervals=[later-earlier for earlier, later in zip(stamps, stamps[1:])]
+    return intervals or [wall], len(stamps), wall
+
+def measureAllocations(call, iterations):
+    """Peak and retained memory allocated by the calls, in KB per call."""
+    tracemalloc.start()
+    before=tracemalloc.get_traced_memory()[0]
+    peak=0
+    for iteration in range(iterations):
+        tracemalloc.reset_peak()
+        call(iteration)
+        peak=max(peak, tracemalloc.get_traced_memory()[1]-before)
+    retained=tracemalloc.get_traced_memory()[0]-before
+    tracemalloc.stop()
+    return {'allocPeakKB': round(peak/1024, 1), 'allocRetainedKB': round(retained/1024/iterations, 1)}
+
+def buildStages(payload):
+    """Returns the stages to benchmark as (name, kind, call, iterations). Kind is "render" or "animation"."""
+    sb=scoreboard
+    provider=sb.providers['NHL']
+    teams=sb.getTeamData(provider)
+    provider.registry=teams
+
+    # A second payload with a goal in every game in progress, so alternate pulls always carry changes.
+    changed=copy.deepcopy(payload)
+    for event in changed['events']:
+        if event['status']['type']['name']=='STATUS_IN_PROGRESS':
+            competitor=event['competitions'][0]['competitors'][0]
+            competitor['score']=str(int(competitor['score'])+1)
+    sb.espn=fixtureClient([payload, changed])
+
+    games=sb.parseGameData(payload)
+    live=[game for game in games if game.status==sb.GameStatus.IN_PROGRESS] or games
+    logo=sb.logos.getLogo(games[0].homeAbbreviation, (40,30)).copy()
+
+    def ingest(iteration):
+        sb.getGameData(provider)
+
+    def buildGame(iteration):
+        sb.scenes=sb.sceneCache()
+        sb.buildGame(games[iteration % len(games)], "none")
+
+    def buildGameCached(iteration):
+        sb.buildGame(games[iteration % len(games)], "none")
+
+    def displayLogos(iteration):
+        game=games[iteration % len(games)]
+        sb.displayLogos(game.awayAbbreviation, game.homeAbbreviation)
+
+    def displayGoal(iteration):
+        goalData=sb.buildGame(live[0], "home")
+        sb.displayGoal(goalData)
+
+    def fadeUp(iteration):
+        sb.fadeBrightness(list(range(0, 100, 7)))
+
+    return [
+        ('getTeamData', 'render', lambda iteration: sb.getTeamData(provider), 50),
+        ('parseGameData', 'render', lambda iteration: sb.parseGameData(payload), 200),
+        ('getGameData', 'render', ingest, 200),
+        ('buildGame', 'render', buildGame, 200),
+        ('buildGameCached', 'render', buildGameCached, 2000),
+        ('displayLogos', 'render', displayLogos, 1000),
+        ('fadeImage', 'render', lambda iteration: sb.fadeImage(logo.copy()), 1000),
+        ('getFrames', 'render', lambda iteration: sb.get_frames(sb.sbPath + "assets/images/idle.gif", (32,32)), 5),
+        ('fadeBrightness', 'animation', fadeUp, 1),
+        ('displayGoal', 'animation', displayGoal, 1),
+        ('display_gif', 'animation', lambda iteration: sb.display_gif(sb.sbPath + "assets/images/idle.gif", 1, (sb.firstMiddleCol,0)), 1),
+        # Moving every 100 ms keeps the clock redrawing, so frame generation can be timed.
+        ('runClock', 'animation', lambda iteration: sb.runClock(2, moveInterval=0.1), 1)
+    ]
+
+def runBenchmarks(config, payload, allocations=True, only=None):
+    """Sets up the scoreboard on the virtual matrix and runs every stage. Returns the results by stage."""
+    # Keep the run off the real caches, and keep every frame of an animation for the frame intervals.
+    config.set('matrix', 'backend', 'virtual')
+    if not config.has_section('virtual'):
+        config.add_section('virtual')
+    config.set('virtual', 'ringSize', '4096')
+    config.set('virtual', 'pngPath', '')
+    config.set('virtual', 'rawPath', '')
+    config.set('scoreboard', 'gifFrameStore', '')
+    # Leave the port and the stats file to the scoreboard running on this board.
+    config.remove_section('metrics')
+    # The fixture is an NHL slate.
+    config.set('NHL', 'enabled', 'True')
+    scoreboard.setupScoreboard(config)
+    provider=scoreboard.providers['NHL']
+    provider.store=scoreboard.gameStore("games.json", scoreboard.cacheWriter('ram'))
+
+    results={}
+    for name, kind, call, iterations in buildStages(payload):
+        if only and name not in only:
+            continue
+        call(0) # Warm up caches the way the first pass of the rotation does.
+        if kind=='render':
+            result=summarize(timeCalls(call, iterations))
+        else:
+            intervals, frames, wall = timeFrames(call)
+            result=summarize(intervals)
+            result['frames']=frames
+            result['fps']=round(frames/wall, 2)
+        if allocations:
+            result.update(measureAllocations(call, min(iterations, 20)))
+        results[name]=result
+        print(formatResult(name, result), flush=True)
+    return results
+
+def formatResult(name, result):
+    line=name.ljust(18) + " p50 " + format(result['p50'], '9.3f') + " ms  p90 " + format(result['p90'], '9.3f') + " ms  p99 " + format(result['p99'], '9.3f') + " ms"
+    if 'fps' in result:
+        line+="  " + format(result['fps'], '6.2f') + " fps"
+    if 'allocPeakKB' in result:
+        line+="  peak " + format(result['allocPeakKB'], '8.1f') + " KB"
+    return line
+
+def compare(results, baseline, threshold):
+    """Prints each stage against the baseline. Returns the names of stages that got slower, or hungrier, by more than threshold."""
+    regressions=[]
+    print("\nAGAINST BASELINE FROM " + baseline['meta']['date'] + " (" + baseline['meta']['machine'] + ")")
+    for name, result in results.items():
+        old=baseline['stages'].get(name)
+        if old is None:
+            print(name.ljust(18) + " new stage")
+            continue
+        changes=[]
+        worse=False
+        # Higher is worse for everything but fps.
+        for metric in ('p50', 'p90', 'fps', 'allocPeakKB'):
+            if metric not in result or not old.get(metric):
+                continue
+            ratio=result[metric]/old[metric]
+            changes.append(metric + " " + format((ratio-1)*100, '+.1f') + "%")
+            if (ratio<1-threshold) if metric=='fps' else (ratio>1+threshold):
+                worse=True
+        print(name.ljust(18) + " " + "  ".join(changes) + ("  REGRESSION" if worse else ""))
+        if worse:
+            regressions.append(name)
+    return regressions
+
+def recordFixture(config, path):
+    """Saves the live scoreboard JSON as a fixture."""
+    config.set('matrix', 'backend', 'virtual')
+    scoreboard.setupScoreboard(config)
+    eventsJson=scoreboard.espn.getJson(SCOREBOARD_URL, False)
+    with open(path, 'w', encoding='utf-8') as fixtureFile:
+        json.dump(eventsJson, fixtureFile, ensure_ascii=False, indent=4)
+    print("Recorded " + str(len(eventsJson['events'])) + " games to " + path)
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description="Benchmark the scoreboard on the virtual matrix.")
+    parser.add_argument('--config', default='rgb_scoreboard.conf', help="scoreboard config to benchmark with")
+    parser.add_argument('--fixture', default=FIXTURE, help="scoreboard JSON to feed the data stages")
+    parser.add_argument('--baseline', default=BASELINE, help="results to compare against")
+    parser.add_argument('--save', action='store_true', help="save the results as the new baseline")
+    parser.add_argument('--output', help="also write the results to this file")
+    parser.add_argument('--threshold', type=float, default=0.15, help="fractional change counted as a regression")
+    parser.add_argument('--stage', action='append', help="only run this stage, can be repeated")
+    parser.add_argument('--no-alloc', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--record', action='store_true', help="save today's scoreboard JSON from ESPN as the fixture and exit")
+    args=parser.parse_args()
+
+    config=configparser.ConfigParser()
+    config.read(args.config)
+
+    if args.record:
+        recordFixture(config, args.fixture)
+        sys.exit(0)
+
+    with open(args.fixture, 'r', encoding='utf-8') as fixtureFile:
+        payload=json.load(fixtureFile)
+
+    results={
+        'meta': {
+            'date': datetime.now().strftime("%Y-%m-%d %H:%M"),
+            'machine': platform.machine() + " " + platform.python_version() + " Pillow " + PIL.__version__,
+            'refreshHz': config.getint('virtual', 'refreshHz', fallback=120)
+        },
+        'stages': runBenchmarks(config, payload, not args.no_alloc, args.stage)
+    }
+
+    for path in ([args.baseline] if args.save else []) + ([args.output] if args.output else []):
+        with open(path, 'w', encoding='utf-8') as resultsFile:
+            json.dump(results, resultsFile, indent=4)
+        print("Saved results to " + path)
+
+    if not args.save:
+        try:
+            with open(args.baseline, 'r', encoding='utf-8') as baselineFile:
+                baseline=json.load(baselineFile)
+        except OSError:
+            print("\nNo baseline at " + args.baseline + ", run with --save to make one.")
+            sys.exit(0)
+        regressions=compare(results['stages'], baseline, args.threshold)
+        if regressions:
+            print("\nREGRESSIONS: " + ", ".join(regressions))
+            sys.exit(1)
@@ -1,10 +1,15 @@
+from libc.stdint cimport uint8_t
 cimport cppinc
 
 cdef class Canvas:
     cdef cppinc.Canvas *__getCanvas(self) except +
+    cdef void __setPixelRow(self, int, int, int, cppinc.Color *) except *
+    cdef void __copyRows(self, uint8_t **, const uint8_t *, Py_ssize_t, int, int, int, int, int, int, int) except *
+    cdef tuple __clipRegion(self, int, int, int, int, rect)
 
 cdef class FrameCanvas(Canvas):
     cdef cppinc.FrameCanvas *__canvas
+    cdef void __setPixelRow(self, int, int, int, cppinc.Color *) except *
 
 cdef class RGBMatrix(Canvas):
     cdef cppinc.RGBMatrix *__matrix
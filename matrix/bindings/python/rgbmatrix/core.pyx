@@ -2,6 +2,8 @@
 
 from libcpp cimport bool
 from libc.stdint cimport uint8_t, uint32_t, uintptr_t
+from libc.stdlib cimport malloc, free
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_C_CONTIGUOUS
 from PIL import Image
 import cython
 
@@ -9,49 +11,135 @@ cdef class Canvas:
     cdef cppinc.Canvas* __getCanvas(self) except +:
         raise Exception("Not implemented")
 
-    def SetImage(self, image, int offset_x = 0, int offset_y = 0, unsafe=True):
-        if (image.mode != "RGB"):
-            raise Exception("Currently, only RGB mode is supported for SetImage(). Please create images with mode 'RGB' or convert first with image = image.convert('RGB'). Pull requests to support more modes natively are also welcome :)")
+    cdef void __setPixelRow(self, int x, int y, int width, cppinc.Color *colors) except *:
+        # Plain canvases only offer SetPixel(). FrameCanvas overrides this to
+        # hand the whole row over in one call.
+        cdef cppinc.Canvas* my_canvas = self.__getCanvas()
+        cdef int col
+        for col in range(width):
+            my_canvas.SetPixel(x + col, y, colors[col].r, colors[col].g, colors[col].b)
 
-        if unsafe:
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef void __copyRows(self, uint8_t **rows, const uint8_t *data, Py_ssize_t stride, int channels,
+                         int src_x, int src_y, int width, int height, int dst_x, int dst_y) except *:
+        # Copies a clipped region row by row, reading each source row
+        # sequentially. Rows come either from a list of row pointers (Pillow)
+        # or from a flat buffer with the given stride.
+        cdef cppinc.Color *colors
+        cdef const uint8_t *src
+        cdef int row, col
+        if width <= 0 or height <= 0:
+            return
+        colors = <cppinc.Color*>malloc(width * sizeof(cppinc.Color))
+        if colors == NULL:
+            raise MemoryError()
+        try:
+            for row in range(height):
+                if rows != NULL:
+                    src = rows[src_y + row] + src_x * channels
+                else:
+                    src = data + (src_y + row) * stride + src_x * channels
+                for col in range(width):
+                    colors[col].r = src[0]
+                    colors[col].g = src[1]
+                    colors[col].b = src[2]
+                    src += channels
+                self.__setPixelRow(dst_x, dst_y + row, width, colors)
+        finally:
+            free(colors)
+
+    cdef tuple __clipRegion(self, int img_width, int img_height, int offset_x, int offset_y, rect):
+        # Returns (src_x, src_y, width, height, dst_x, dst_y) of the part of
+        # the source that lands on the canvas. 'rect' is (x, y, width, height)
+        # in source coordinates and ends up where it would in a full update.
+        cdef cppinc.Canvas* my_canvas = self.__getCanvas()
+        cdef int src_x = 0, src_y = 0, width = img_width, height = img_height
+        cdef int dst_x, dst_y
+        if rect is not None:
+            src_x, src_y, width, height = rect
+            if src_x < 0:
+                width += src_x
+                src_x = 0
+            if src_y < 0:
+                height += src_y
+                src_y = 0
+            width = min(width, img_width - src_x)
+            height = min(height, img_height - src_y)
+        dst_x = offset_x + src_x
+        dst_y = offset_y + src_y
+        if dst_x < 0:
+            src_x -= dst_x
+            width += dst_x
+            dst_x = 0
+        if dst_y < 0:
+            src_y -= dst_y
+            height += dst_y
+            dst_y = 0
+        width = min(width, my_canvas.width() - dst_x)
+        height = min(height, my_canvas.height() - dst_y)
+        return (src_x, src_y, width, height, dst_x, dst_y)
+
+    def SetImage(self, image, int offset_x = 0, int offset_y = 0, unsafe=True, rect=None):
+        """Copies a Pillow image of mode 'RGB' or 'RGBA' to the canvas.
+
+        Alpha is ignored, as if the image had been converted to 'RGB' first.
+        With 'rect' = (x, y, width, height) only that part of the image is
+        copied, to where it would land in a full update.
+        """
+        if image.mode not in ("RGB", "RGBA"):
+            raise Exception("Currently, only RGB and RGBA modes are supported for SetImage(). Please create images with mode 'RGB' or convert first with image = image.convert('RGB'). Pull requests to support more modes natively are also welcome :)")
+
+        img_width, img_height = image.size
+        image.load()
+        if unsafe and hasattr(image.im, "unsafe_ptrs"):
             #In unsafe mode we directly access the underlying PIL image array
             #in cython, which is considered unsafe pointer accecss,
             #however it's super fast and seems to work fine
             #https://groups.google.com/forum/#!topic/cython-users/Dc1ft5W6KM4
-            img_width, img_height = image.size
-            self.SetPixelsPillow(offset_x, offset_y, img_width, img_height, image)
+            self.SetPixelsPillow(offset_x, offset_y, img_width, img_height, image, rect)
         else:
-            # First implementation of a SetImage(). OPTIMIZE_ME: A more native
-            # implementation that directly reads the buffer and calls the underlying
-            # C functions can certainly be faster.
-            img_width, img_height = image.size
-            pixels = image.load()
-            for x in range(max(0, -offset_x), min(img_width, self.width - offset_x)):
-                for y in range(max(0, -offset_y), min(img_height, self.height - offset_y)):
-                    (r, g, b) = pixels[x, y]
-                    self.SetPixel(x + offset_x, y + offset_y, r, g, b)
+            # Safe mode copies the pixels out of the image first and then
+            # takes the same native path as any other buffer.
+            channels = 4 if image.mode == "RGBA" else 3
+            self.SetBuffer(image.tobytes(), img_width, img_height, offset_x, offset_y, channels, 0, rect)
+
+    def SetBuffer(self, buffer, int width, int height, int offset_x = 0, int offset_y = 0,
+                  int channels = 3, Py_ssize_t stride = 0, rect=None):
+        """Copies packed RGB or RGBA pixels from any buffer-protocol object.
+
+        This takes bytes, bytearray, memoryview, array.array or a C-contiguous
+        NumPy uint8 array. 'channels' is 3 for RGB and 4 for RGBA (alpha is
+        ignored), 'stride' is the bytes per row and defaults to width *
+        channels. 'rect' works like it does for SetImage().
+        """
+        cdef Py_buffer view
+        if channels != 3 and channels != 4:
+            raise ValueError("channels must be 3 (RGB) or 4 (RGBA)")
+        if stride == 0:
+            stride = width * channels
+        if width <= 0 or height <= 0:
+            return
+        PyObject_GetBuffer(buffer, &view, PyBUF_C_CONTIGUOUS)
+        try:
+            if stride < width * channels or view.len < (height - 1) * stride + width * channels:
+                raise ValueError("buffer is too small for a %dx%d image with %d channels and a stride of %d" % (width, height, channels, stride))
+            src_x, src_y, clip_width, clip_height, dst_x, dst_y = self.__clipRegion(width, height, offset_x, offset_y, rect)
+            self.__copyRows(NULL, <const uint8_t*>view.buf, stride, channels, src_x, src_y, clip_width, clip_height, dst_x, dst_y)
+        finally:
+            PyBuffer_Release(&view)
 
     @cython.boundscheck(False)
     @cython.wraparound(False)
-    def SetPixelsPillow(self, int xstart, int ystart, int width, int height, image):
-        cdef cppinc.FrameCanvas* my_canvas = <cppinc.FrameCanvas*>self.__getCanvas()
-        cdef int frame_width = my_canvas.width()
-        cdef int frame_height = my_canvas.height()
-        cdef int row, col
-        cdef uint8_t r, g, b
-        cdef uint32_t **image_ptr
-        cdef uint32_t pixel
+    def SetPixelsPillow(self, int xstart, int ystart, int width, int height, image, rect=None):
+        cdef uint8_t **image_ptr
         image.load()
         ptr_tmp = dict(image.im.unsafe_ptrs)['image32']
-        image_ptr = (<uint32_t **>(<uintptr_t>ptr_tmp))
+        image_ptr = (<uint8_t **>(<uintptr_t>ptr_tmp))
 
-        for col in range(max(0, -xstart), min(width, frame_width - xstart)):
-            for row in range(max(0, -ystart), min(height, frame_height - ystart)):
-                pixel = image_ptr[row][col]
-                r = (pixel ) & 0xFF
-                g = (pixel >> 8) & 0xFF
-                b = (pixel >> 16) & 0xFF
-                my_canvas.SetPixel(xstart+col, ystart+row, r, g, b)
+        # Pillow keeps RGB and RGBA pixels as 4 bytes each, one pointer per row.
+        src_x, src_y, clip_width, clip_height, dst_x, dst_y = self.__clipRegion(width, height, xstart, ystart, rect)
+        self.__copyRows(image_ptr, NULL, 0, 4, src_x, src_y, clip_width, clip_height, dst_x, dst_y)
 
 cdef class FrameCanvas(Canvas):
     def __dealloc__(self):
@@ -72,6 +160,9 @@ cdef class FrameCanvas(Canvas):
     def SetPixel(self, int x, int y, uint8_t red, uint8_t green, uint8_t blue):
         (<cppinc.FrameCanvas*>self.__getCanvas()).SetPixel(x, y, red, green, blue)
 
+    cdef void __setPixelRow(self, int x, int y, int width, cppinc.Color *colors) except *:
+        (<cppinc.FrameCanvas*>self.__getCanvas()).SetPixels(x, y, width, 1, colors)
+
 
     property width:
         def __get__(self): return (<cppinc.FrameCanvas*>self.__getCanvas()).width()
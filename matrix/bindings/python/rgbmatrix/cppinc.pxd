@@ -25,6 +25,7 @@ cdef extern from "led-matrix.h" namespace "rgb_matrix":
         FrameCanvas *SwapOnVSync(FrameCanvas*, uint8_t)
 
     cdef cppclass FrameCanvas(Canvas):
+        void SetPixels(int, int, int, int, Color*) nogil
         bool SetPWMBits(uint8_t)
         uint8_t pwmbits()
         void SetBrightness(uint8_t)
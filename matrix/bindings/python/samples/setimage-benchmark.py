@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# Times the ways of getting pixels onto an offscreen canvas.
+import time
+from samplebase import SampleBase
+from PIL import Image
+
+
+class SetImageBenchmark(SampleBase):
+    def __init__(self, *args, **kwargs):
+        super(SetImageBenchmark, self).__init__(*args, **kwargs)
+        self.parser.add_argument("--iterations", help="Calls to time for each method. Default: 200", default=200, type=int)
+
+    def timeit(self, name, pixels, call):
+        call()
+        iterations = self.args.iterations
+        start = time.perf_counter()
+        for i in range(iterations):
+            call()
+        elapsed = (time.perf_counter() - start) / iterations
+        print("%-32s %10.1f us/call %8.2f Mpixels/s" % (name, elapsed * 1e6, pixels / elapsed / 1e6))
+
+    def run(self):
+        canvas = self.matrix.CreateFrameCanvas()
+        width, height = canvas.width, canvas.height
+        pixels = width * height
+
+        rgb = Image.new("RGB", (width, height))
+        rgb.putdata([(x * 255 // width, y * 255 // height, 128) for y in range(height) for x in range(width)])
+        rgba = rgb.convert("RGBA")
+        raw = rgb.tobytes()
+        loaded = rgb.load()
+
+        def set_pixel_loop():
+            # What SetImage(unsafe=False) used to do.
+            for x in range(width):
+                for y in range(height):
+                    (r, g, b) = loaded[x, y]
+                    canvas.SetPixel(x, y, r, g, b)
+
+        self.timeit("SetPixel() loop", pixels, set_pixel_loop)
+        self.timeit("SetImage(RGB)", pixels, lambda: canvas.SetImage(rgb))
+        self.timeit("SetImage(RGB, unsafe=False)", pixels, lambda: canvas.SetImage(rgb, unsafe=False))
+        self.timeit("SetImage(RGBA.convert('RGB'))", pixels, lambda: canvas.SetImage(rgba.convert("RGB")))
+        self.timeit("SetImage(RGBA)", pixels, lambda: canvas.SetImage(rgba))
+        self.timeit("SetBuffer(bytes)", pixels, lambda: canvas.SetBuffer(raw, width, height))
+        self.timeit("SetBuffer(memoryview)", pixels, lambda: canvas.SetBuffer(memoryview(raw), width, height))
+        self.timeit("SetImage(RGB, rect=16x16)", 16 * 16, lambda: canvas.SetImage(rgb, rect=(8, 8, 16, 16)))
+
+        try:
+            import numpy
+            array = numpy.asarray(rgb)
+            self.timeit("SetBuffer(numpy)", pixels, lambda: canvas.SetBuffer(array, width, height))
+        except ImportError:
+            pass
+
+
+# Main function
+if __name__ == "__main__":
+    set_image_benchmark = SetImageBenchmark()
+    if (not set_image_benchmark.process()):
+        set_image_benchmark.print_help()
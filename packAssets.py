@@ -0,0 +1,89 @@
+"""Builds the asset pack: every logo, goal gif and glyph the scoreboard draws, ready to go straight onto the panel.
+
+Logos are packed for every enabled league. They're cropped, resized and faded, gif frames decoded and resized to the panel, and glyphs rasterized, all by the
+scoreboard's own code so the pixels are the same. They're written to one file that the scoreboard memory maps at
+start instead of doing that work itself. Rebuild it after changing the panel size in the config or any of the assets,
+the scoreboard ignores a pack that doesn't match. Run from the scoreboard directory:
+    python packAssets.py
+"""
+import argparse
+import configparser
+import os
+import time
+
+import scoreboard
+
+# Every way the scoreboard draws a logo, as (size, fade direction, black level). See displayLogos and buildLoading.
+TEAM_LOGOS = [((40,30), True, 225), ((40,30), False, 225)]
+LEAGUE_LOGOS = [((40,30), None, 255)]
+IDLE_GIF = ("assets/images/idle.gif", (25,32))
+GLYPHS = [chr(code) for code in range(32, 127)]
+
+def listDir(path, extension):
+    """Files in a folder under sbPath with an extension, or none if there's no folder."""
+    path=scoreboard.sbPath + path
+    return sorted(name for name in os.listdir(path) if name.endswith(extension)) if os.path.isdir(path) else []
+
+def teamAbbreviations(provider):
+    """Every team in a league with a logo, from the team registry and the logo directory."""
+    teams=set(os.path.splitext(name)[0] for name in listDir(provider.logoDir, '.png'))
+    try:
+        provider.registry=scoreboard.getTeamData(provider)
+        teams.update(team.abbreviation for team in provider.registry)
+    except Exception as e:
+        print("No " + provider.key + " team data, packing the logos on disk: " + str(e))
+    return sorted(teams)
+
+def buildEntries():
+    """Renders every asset. Returns the entries for assetPack.write and the source files they came from."""
+    sb=scoreboard
+    entries={}
+    sources=set()
+
+    # A cache big enough to hold everything, with nothing packed yet, so every logo is built from its PNG.
+    logos=sb.logoCache(1 << 20)
+    for provider in sb.providers.values():
+        for team in teamAbbreviations(provider):
+            if not os.path.exists(sb.logoPath(team, provider.key)):
+                continue
+            for size, reverse, black in TEAM_LOGOS:
+                entries[sb.assetPack.logoKey(team, size, reverse, black, provider.key)]=[(logos.getLogo(team, size, reverse, black, provider.key), None)]
+            sources.add(sb.relativePath(sb.logoPath(team, provider.key)))
+    for size, reverse, black in LEAGUE_LOGOS:
+        entries[sb.assetPack.logoKey("NHL", size, reverse, black)]=[(logos.getLogo("NHL", size, reverse, black), None)]
+    sources.add(sb.relativePath(sb.logoPath("NHL")))
+
+    gifs=[(provider.goalDir + name, (sb.fullWidth, sb.options.rows)) for provider in sb.providers.values() for name in listDir(provider.goalDir, '.gif')]
+    for path, size in gifs + [IDLE_GIF]:
+        entries[sb.assetPack.gifKey(sb.sbPath + path, size)]=sb.get_frames(sb.sbPath + path, size)
+        sources.add(path)
+
+    glyphs=sb.glyphAtlas()
+    for font in (sb.fontMedium, sb.fontLarge):
+        for char in GLYPHS:
+            mask, offset = glyphs.getMask(font, char)
+            entries[sb.assetPack.glyphKey(font, char)]=[(mask, list(offset))]
+        sources.add(sb.relativePath(font.path))
+    return entries, sorted(sources)
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description="Build the asset pack for the panel in the config.")
+    parser.add_argument('--config', default='rgb_scoreboard.conf', help="scoreboard config to build for")
+    parser.add_argument('--output', help="where to write the pack, defaults to assetPack in the config")
+    args=parser.parse_args()
+
+    config=configparser.ConfigParser()
+    config.read(args.config)
+    path=args.output or config.get('scoreboard', 'assetPack', fallback='') or "./cache/assets.pack"
+    # Only the panel size matters here, so never touch the hardware, and build from the assets rather than a pack.
+    config.set('matrix', 'backend', 'virtual')
+    config.set('scoreboard', 'assetPack', '')
+    config.remove_section('metrics')
+    scoreboard.setupScoreboard(config)
+
+    start=time.perf_counter()
+    entries, sources = buildEntries()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    scoreboard.assetPack.write(path, (scoreboard.fullWidth, scoreboard.options.rows), sources, entries)
+    print("Packed " + str(len(entries)) + " assets from " + str(len(sources)) + " files for " + str(scoreboard.fullWidth) + "x" + str(scoreboard.options.rows)
+          + " into " + path + " (" + str(os.path.getsize(path)//1024) + " KB) in " + format(time.perf_counter()-start, '.2f') + " s")
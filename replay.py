@@ -0,0 +1,184 @@
+"""Replays a recorded game night through the scoreboard on the virtual matrix, at up to 100x speed.
+
+Record a night by setting feedLog in rgb_scoreboard.conf, for example ./cache/feed-%Y-%m-%d.log.gz. Every payload
+pulled from the API is then appended to that log. This feeds those payloads back to runScoreboard on a clock that
+starts at the first pull and runs speed times faster than real time, so goal, period and rotation logic can be
+reproduced on demand. When the log runs out it reports how long each goal took from the pull that carried it to
+its score being on the panel.
+
+Run from the scoreboard directory:
+    python replay.py cache/feed-2026-10-18.log.gz --speed 20
+"""
+from datetime import datetime
+import argparse
+import configparser
+import logging
+import random
+import sys
+import threading
+import time
+
+import scoreboard
+
+class replayFinished(BaseException):
+    """Raised on the main thread when the clock runs past the end of the log. Not an Exception, so the scoreboard's
+    own error handling doesn't catch it."""
+
+class replayClock(scoreboard.systemClock):
+    """A clock that starts at a given time and runs speed times faster than real time."""
+    def __init__(self, start, speed, end):
+        self.start=start
+        self.speed=speed
+        self.end=end
+        self.realStart=time.monotonic()
+
+    def checkEnd(self, now):
+        if now>self.end and threading.current_thread() is threading.main_thread():
+            raise replayFinished()
+
+    def now(self, tz=None):
+        now=self.time()
+        self.checkEnd(now)
+        return datetime.fromtimestamp(now, tz)
+
+    def time(self):
+        return self.start+(time.monotonic()-self.realStart)*self.speed
+
+    def monotonic(self):
+        return (time.monotonic()-self.realStart)*self.speed
+
+    def sleep(self, seconds):
+        self.checkEnd(self.time())
+        time.sleep(max(seconds, 0)/self.speed)
+
+    def timeout(self, seconds):
+        return None if seconds is None else seconds/self.speed
+
+class replayFeed:
+    """Stands in for the ESPN httpClient, answering each pull with the newest payload recorded by then."""
+    def __init__(self, records, clock):
+        self.records=records
+        self.clock=clock
+        self.index=0
+        self.served=None
+        self.pulls=0
+
+    def getJson(self, url, conditional=True):
+        now=self.clock.time()
+        while self.index+1<len(self.records) and self.records[self.index+1][0]<=now:
+            self.index+=1
+        self.pulls+=1
+        if conditional and self.served==self.index:
+            return None # Not modified.
+        self.served=self.index
+        return self.records[self.index][1]
+
+    def pulledAt(self):
+        """When the payload last served was originally pulled."""
+        return self.records[self.served][0]
+
+class goalLatency:
+    """Times each goal from the pull that carried it, to the tracker seeing it, to its score reaching the panel."""
+    def __init__(self, feed, clock):
+        self.feed=feed
+        self.clock=clock
+        self.pending={}
+        self.showing=None
+        self.goals=[]
+
+    def goalDetected(self, gameEvent):
+        # Goals that pile up before the card comes around are timed from the first.
+        game=gameEvent.game
+        if game.gameId not in self.pending:
+            self.pending[game.gameId]=(self.feed.pulledAt(), self.clock.time())
+
+    def cardBuilt(self, game, scoringTeam):
+        if scoringTeam!="none" and game.gameId in self.pending:
+            self.showing=game
+
+    def frameShown(self):
+        if self.showing is None:
+            return
+        game=self.showing
+        self.showing=None
+        pulled, detected = self.pending.pop(game.gameId)
+        self.goals.append((game, pulled, detected-pulled, self.clock.time()-pulled))
+
+    def report(self):
+        print("\nGOAL TO PIXEL LATENCY - GOALS: " + str(len(self.goals)) + " NEVER SHOWN: " + str(len(self.pending)))
+        for game, pulled, detect, pixel in self.goals:
+            print(datetime.fromtimestamp(pulled).strftime("%H:%M:%S") + "  " + (game.awayAbbreviation + " " + str(game.awayScore) + " @ " + game.homeAbbreviation + " " + str(game.homeScore)).ljust(18)
+                  + " detected " + format(detect, '6.1f') + " s  on panel " + format(pixel, '6.1f') + " s")
+        if self.goals:
+            pixels=sorted(goal[3] for goal in self.goals)
+            print("ON PANEL - MIN: " + format(pixels[0], '.1f') + " s  MEDIAN: " + format(pixels[len(pixels)//2], '.1f') + " s  MAX: " + format(pixels[-1], '.1f') + " s")
+
+def instrument(latency):
+    """Hooks the latency probe into the tracker, the card builder and the output."""
+    sb=scoreboard
+    sb.tracker.subscribe(sb.GameEventType.GOAL, latency.goalDetected)
+
+    buildGame=sb.buildGame
+    def timedBuildGame(game, scoringTeam):
+        latency.cardBuilt(game, scoringTeam)
+        return buildGame(game, scoringTeam)
+    sb.buildGame=timedBuildGame
+
+    show=sb.output.show
+    def timedShow(frame, offset=(0,0)):
+        show(frame, offset)
+        latency.frameShown()
+    sb.output.show=timedShow
+
+if __name__ == "__main__":
+    parser=argparse.ArgumentParser(description="Replay a recorded feed log through the scoreboard on the virtual matrix.")
+    parser.add_argument('feed', help="feed log written with feedLog set")
+    parser.add_argument('--config', default='rgb_scoreboard.conf', help="scoreboard config to replay with")
+    parser.add_argument('--speed', type=float, default=10, help="how many times faster than real time to run, 1 to 100")
+    parser.add_argument('--tail', type=float, default=300, help="seconds to keep running after the last pull")
+    parser.add_argument('--seed', type=int, default=0, help="seed for poll jitter and the clock screensaver")
+    parser.add_argument('--verbose', action='store_true', help="show the scoreboard's log")
+    args=parser.parse_args()
+    if not 1<=args.speed<=100:
+        parser.error("speed must be between 1 and 100")
+
+    records=scoreboard.readFeed(args.feed)
+    if not records:
+        sys.exit("No pulls in " + args.feed)
+    print("REPLAY - PULLS: " + str(len(records)) + " FROM " + datetime.fromtimestamp(records[0][0]).strftime("%Y-%m-%d %H:%M:%S")
+          + " TO " + datetime.fromtimestamp(records[-1][0]).strftime("%H:%M:%S") + " AT " + str(args.speed) + "x", flush=True)
+
+    config=configparser.ConfigParser()
+    config.read(args.config)
+    config.set('matrix', 'backend', 'virtual')
+    config.set('scoreboard', 'feedLog', '')
+    # Leave the port and the stats file to the scoreboard running on this board.
+    config.remove_section('metrics')
+    # Only the NHL is replayed, with the records for it in the log.
+    for section in config.sections():
+        if config.has_option(section, 'enabled'):
+            config.set(section, 'enabled', str(section=='NHL'))
+
+    if args.verbose:
+        logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', level=logging.INFO)
+    random.seed(args.seed)
+
+    # The clock has to be in place before setup, so the virtual matrix refreshes on it too.
+    clock=replayClock(records[0][0], args.speed, records[-1][0]+args.tail)
+    scoreboard.clock=clock
+    scoreboard.setupScoreboard(config)
+    # Start cold and keep the real games cache out of it.
+    provider=scoreboard.providers['NHL']
+    provider.store=scoreboard.gameStore("games.json", scoreboard.cacheWriter('ram'))
+    feed=replayFeed(records, clock)
+    scoreboard.espn=feed
+    latency=goalLatency(feed, clock)
+    instrument(latency)
+
+    start=time.monotonic()
+    try:
+        scoreboard.runScoreboard()
+    except replayFinished:
+        pass
+    print("REPLAY DONE - " + format(time.monotonic()-start, '.1f') + " s, " + str(feed.pulls) + " PULLS, " + str(scoreboard.matrix.frameCount) + " FRAMES")
+    latency.report()
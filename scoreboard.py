@@ -1,193 +1,1880 @@
 #!/usr/bin/env python
-from PIL import Image, ImageDraw, ImageFont, ImageSequence
-from rgbmatrix import RGBMatrix, RGBMatrixOptions
+from PIL import Image, ImageChops, ImageDraw, ImageFont, ImageSequence
+try:
+    from rgbmatrix import RGBMatrix, RGBMatrixOptions
+except ImportError as e:
+    # No LED hardware bindings, only the virtual matrix is available. Kept to report if the hardware is asked for.
+    RGBMatrix = None
+    rgbmatrixError = e
 from datetime import datetime, timezone, timedelta
 from os.path import exists
+from collections import OrderedDict, deque
+from enum import Enum
+from typing import NamedTuple
 import configparser
+import functools
+import gzip
+import hashlib
+import http.server
 import logging
+import logging.handlers
+import queue
+import atexit
 import requests
 import json
 import time
 import math
+import bisect
+import mmap
+import os
 import random
+import struct
+import threading
+
+logger = logging.getLogger('scoreboard')
+moduleLoaded = time.monotonic()
+
+def secondsSinceStart():
+    """Seconds since the process started, from /proc. Falls back to the time since this module was loaded."""
+    try:
+        with open('/proc/self/stat') as statFile:
+            # The process name can hold spaces, so fields are counted from after it. Start time is field 22.
+            startTicks = int(statFile.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as uptimeFile:
+            uptime = float(uptimeFile.read().split()[0])
+        return uptime - startTicks/os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError):
+        return time.monotonic() - moduleLoaded
+
+class systemClock:
+    """Tells the time and waits. Everything that does either goes through the clock, so a replay can run it faster."""
+    def now(self, tz=None):
+        return datetime.now(tz)
+
+    def time(self):
+        return time.time()
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def timeout(self, seconds):
+        """Converts a wait in clock seconds to real seconds, for waits on events and conditions."""
+        return seconds
+
+clock = systemClock()
+
+class metricsRegistry:
+    """Counters, gauges and histograms, exported in the Prometheus text format.
+
+    Metrics are declared once with their help text, then updated from any thread. Each update is a dict lookup and an
+    add under a lock, cheap enough for every frame. Collectors are called just before exporting, for values that are
+    already counted elsewhere, like the cache hit counts.
+    """
+    def __init__(self):
+        self.lock=threading.Lock()
+        self.metrics=OrderedDict() # Name to (type, help, buckets).
+        self.values={} # (name, labels) to a number, or for histograms [bucket counts, sum, count].
+        self.collectors=[]
+
+    def counter(self, name, help):
+        self.metrics[name]=('counter', help, None)
+
+    def gauge(self, name, help):
+        self.metrics[name]=('gauge', help, None)
+
+    def histogram(self, name, help, buckets):
+        self.metrics[name]=('histogram', help, tuple(buckets))
+
+    def collect(self, collector):
+        """Calls collector with no arguments before every export."""
+        self.collectors.append(collector)
+
+    def inc(self, name, amount=1, **labels):
+        key=(name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.values[key]=self.values.get(key, 0)+amount
+
+    def set(self, name, value, **labels):
+        with self.lock:
+            self.values[(name, tuple(sorted(labels.items())))]=value
+
+    def observe(self, name, value, **labels):
+        key=(name, tuple(sorted(labels.items())))
+        buckets=self.metrics[name][2]
+        with self.lock:
+            histogram=self.values.get(key)
+            if histogram is None:
+                histogram=self.values[key]=[[0]*len(buckets), 0, 0]
+            index=bisect.bisect_left(buckets, value)
+            if index<len(buckets):
+                histogram[0][index]+=1
+            histogram[1]+=value
+            histogram[2]+=1
+
+    def export(self):
+        """Returns every metric in the Prometheus text format."""
+        for collector in self.collectors:
+            try:
+                collector()
+            except Exception as e:
+                logger.error('Error %s', 'collecting metrics', exc_info=e)
+        with self.lock:
+            values=sorted((key, value if not isinstance(value, list) else [list(value[0]), value[1], value[2]]) for key, value in self.values.items())
+        lines=[]
+        for name, (kind, help, buckets) in self.metrics.items():
+            lines.append("# HELP " + name + " " + help)
+            lines.append("# TYPE " + name + " " + kind)
+            for (valueName, labels), value in values:
+                if valueName!=name:
+                    continue
+                if kind!='histogram':
+                    lines.append(name + formatLabels(labels) + " " + formatNumber(value))
+                    continue
+                counts, total, count = value
+                cumulative=0
+                for bound, bucketCount in zip(buckets, counts):
+                    cumulative+=bucketCount
+                    lines.append(name + "_bucket" + formatLabels(labels + (('le', formatNumber(bound)),)) + " " + str(cumulative))
+                lines.append(name + "_bucket" + formatLabels(labels + (('le', "+Inf"),)) + " " + str(count))
+                lines.append(name + "_sum" + formatLabels(labels) + " " + formatNumber(total))
+                lines.append(name + "_count" + formatLabels(labels) + " " + str(count))
+        return "\n".join(lines) + "\n"
+
+def formatLabels(labels):
+    if not labels:
+        return ""
+    escaped=(str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return "{" + ",".join(key + '="' + value + '"' for (key, _), value in zip(labels, escaped)) + "}"
+
+def formatNumber(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+metrics = metricsRegistry()
+metrics.histogram('scoreboard_http_request_seconds', "Time to get a response from ESPN, by endpoint.", (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10))
+metrics.counter('scoreboard_http_requests_total', "Requests to ESPN, by endpoint and status code.")
+metrics.counter('scoreboard_http_response_bytes_total', "Bytes downloaded from ESPN, by endpoint.")
+metrics.counter('scoreboard_fetch_failures_total', "Game data fetches that failed, by league.")
+metrics.histogram('scoreboard_parse_seconds', "Time to turn a changed scoreboard payload into games, by league.", (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1))
+metrics.gauge('scoreboard_games_age_seconds', "Time since a league's games were last fetched successfully.")
+metrics.counter('scoreboard_cache_requests_total', "Lookups in the logo, gif and scene caches, by cache and hit or miss.")
+metrics.histogram('scoreboard_card_render_seconds', "Time to build a game card, by whether it came from the scene cache.", (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05))
+metrics.histogram('scoreboard_setimage_seconds', "Time to push a frame to the matrix canvas, by full or partial push.", (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025))
+metrics.histogram('scoreboard_animation_fps', "Frame rate each animation achieved, by animation.", (5, 10, 15, 20, 25, 30, 40, 50, 60, 90, 120))
+metrics.counter('scoreboard_animation_frames_dropped_total', "Animation frames dropped to stay on time, by animation.")
+metrics.histogram('scoreboard_goal_delay_seconds', "Time from the pull that carried a goal to its goal animation starting.", (1, 5, 10, 20, 30, 60, 120, 300, 600))
+metrics.gauge('scoreboard_first_frame_seconds', "Time from process start to the first frame.")
+metrics.counter('scoreboard_bytes_written_total', "Bytes written to files, by what wrote them.")
+
+class metricsExporter(threading.Thread):
+    """Serves the metrics to Prometheus over HTTP and writes them to a stats file every interval seconds.
+
+    The stats file suits node_exporter's textfile collector, for boards that can't be scraped directly. It's handed to
+    the cacheWriter like the cache files, so it's never read half written and the cache mode keeps it off the SD card.
+    """
+    def __init__(self, registry, address='127.0.0.1', port=0, statsPath='', interval=60):
+        super().__init__(name="metrics", daemon=True)
+        self.registry=registry
+        self.statsPath=statsPath
+        self.interval=interval
+        self.server=None
+        if port:
+            registry=self.registry
+            class metricsHandler(http.server.BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split('?')[0] not in ('/', '/metrics'):
+                        self.send_error(404)
+                        return
+                    body=registry.export().encode('utf-8')
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    pass # Scrapes would flood the log.
+            self.server=http.server.ThreadingHTTPServer((address, port), metricsHandler)
+            self.server.daemon_threads=True
+
+    def run(self):
+        if self.server:
+            threading.Thread(target=self.server.serve_forever, name="metricsHttp", daemon=True).start()
+            logger.info("METRICS - SERVING ON " + self.server.server_address[0] + ":" + str(self.server.server_address[1]))
+        if self.statsPath:
+            logger.info("METRICS - STATS FILE " + ("KEPT IN MEMORY" if cacheFiles.mode=='ram' else "AT " + cacheFiles.locate(self.statsPath)))
+        while self.statsPath:
+            clock.sleep(self.interval)
+            self.writeStats()
+
+    def writeStats(self):
+        cacheFiles.write(self.statsPath, lambda: self.registry.export().encode('utf-8'), 'stats')
 
 class cacheInfo:
     def __init__(self):
         self.lastCacheTime=''
-        self.gameCacheDelay=0
+        self.games=None # Last parsed games, reused when the API says nothing changed.
+
+class pollScheduler:
+    """Decides when game data is fetched next, from the state of the games.
 
-    def endTime(self):
-        return self.lastCacheTime + timedelta(seconds=self.gameCacheDelay)
+    Live games are polled often, intermissions less so, and before the first puck drop the next poll lands just
+    ahead of the start time. Every interval gets some jitter, and failures back off through a retryPolicy.
+    All times are timezone aware, so local and UTC times can't be mixed up.
+    """
+    def __init__(self, liveInterval=10, intermissionInterval=60, preGameInterval=1800, preGameLead=60, finalInterval=3600, noGamesInterval=3600, jitter=0.1, maxBackoff=300, name="NHL"):
+        self.name=name # League being polled, for the log.
+        self.liveInterval=liveInterval
+        self.intermissionInterval=intermissionInterval
+        self.preGameInterval=preGameInterval
+        self.preGameLead=preGameLead
+        self.finalInterval=finalInterval
+        self.noGamesInterval=noGamesInterval
+        self.jitter=jitter
+        self.backoff=retryPolicy(liveInterval, maxBackoff, jitter)
+        self.failures=0
+        self.state="none"
+        self.nextWake=clock.now(timezone.utc)
+
+    def gameState(self, games, now):
+        """Returns the state that decides the poll rate: live, intermission, pregame, final or none."""
+        if not games:
+            return "none"
+        statuses=set(game.status for game in games)
+        if statuses-{GameStatus.SCHEDULED, GameStatus.END_PERIOD, GameStatus.HALFTIME, GameStatus.FINAL, GameStatus.POSTPONED, GameStatus.CANCELED}:
+            return "live"
+        # A game past its start time that still says scheduled is about to go live.
+        if any(game.status==GameStatus.SCHEDULED and game.startTimeLocal<=now for game in games):
+            return "live"
+        if GameStatus.END_PERIOD in statuses or GameStatus.HALFTIME in statuses:
+            return "intermission"
+        if GameStatus.SCHEDULED in statuses:
+            return "pregame"
+        return "final"
+
+    def schedule(self, games, now=None):
+        """Sets the next wake time after a successful fetch. Returns it."""
+        now=now or clock.now(timezone.utc)
+        self.failures=0
+        self.state=self.gameState(games, now)
+        if self.state=="live":
+            interval=self.liveInterval
+        elif self.state=="intermission":
+            interval=self.intermissionInterval
+        elif self.state=="pregame":
+            firstStart=min(game.startTimeLocal for game in games if game.status==GameStatus.SCHEDULED)
+            interval=(firstStart-now).total_seconds()-self.preGameLead
+            interval=min(max(interval,self.liveInterval),self.preGameInterval)
+        elif self.state=="final":
+            interval=self.finalInterval
+        else:
+            interval=self.noGamesInterval
+        return self.wakeIn(interval, now)
+
+    def failed(self, now=None):
+        """Sets the next wake time after a failed fetch, backing off with each failure in a row. Returns it."""
+        now=now or clock.now(timezone.utc)
+        self.failures+=1
+        return self.wakeIn(self.backoff.delay(self.failures-1), now, False)
+
+    def wakeAt(self, wakeTime):
+        """Sets the next wake time directly, for when something other than the games decides it."""
+        self.nextWake=wakeTime
+
+    def wakeIn(self, interval, now, addJitter=True):
+        if addJitter:
+            interval*=1+random.uniform(-self.jitter, self.jitter)
+        self.nextWake=now+timedelta(seconds=interval)
+        logger.info("NEXT POLL " + self.name + " - STATE: " + self.state + " FAILURES: " + str(self.failures) + " IN: " + str(round(interval)) + "s")
+        return self.nextWake
+
+    def refresh(self):
+        """Makes a poll due right away."""
+        self.nextWake=clock.now(timezone.utc)
+
+    def secondsUntilWake(self):
+        return max((self.nextWake-clock.now(timezone.utc)).total_seconds(), 0)
+
+class retryPolicy:
+    """Exponential backoff with jitter. The delay doubles with each attempt up to maxDelay."""
+    def __init__(self, baseDelay=1, maxDelay=300, jitter=0.2):
+        self.baseDelay=baseDelay
+        self.maxDelay=maxDelay
+        self.jitter=jitter
+
+    def delay(self, attempt):
+        """Returns how many seconds to wait before retry number attempt, counting from 0."""
+        delay=min(self.baseDelay*2**attempt, self.maxDelay)
+        return delay*(1+random.uniform(-self.jitter, self.jitter))
+
+class circuitBreaker:
+    """Stops requests to an upstream that keeps failing.
+
+    After failureThreshold failures in a row the circuit opens and no requests are allowed. Once the open delay
+    has passed a single probe is let through (half-open). If it succeeds the circuit closes, if it fails the circuit
+    opens again for longer.
+    """
+    def __init__(self, failureThreshold=3, openPolicy=None, name="NHL"):
+        self.name=name # Upstream the circuit is for, for the log.
+        self.failureThreshold=failureThreshold
+        self.openPolicy=openPolicy or retryPolicy(30, 900)
+        self.state="closed"
+        self.failures=0
+        self.opened=0
+        self.probeTime=None
+
+    def allowRequest(self, now=None):
+        now=now or clock.now(timezone.utc)
+        if self.state=="open" and now>=self.probeTime:
+            self.state="half-open"
+            logger.info("CIRCUIT " + self.name + " HALF-OPEN - PROBING")
+            return True
+        return self.state!="open"
+
+    def recordSuccess(self):
+        if self.state!="closed":
+            logger.info("CIRCUIT " + self.name + " CLOSED")
+        self.state="closed"
+        self.failures=0
+        self.opened=0
+
+    def recordFailure(self, now=None):
+        now=now or clock.now(timezone.utc)
+        self.failures+=1
+        if self.state=="half-open" or self.failures>=self.failureThreshold:
+            self.state="open"
+            self.probeTime=now+timedelta(seconds=self.openPolicy.delay(self.opened))
+            self.opened+=1
+            logger.info("CIRCUIT " + self.name + " OPEN - FAILURES: " + str(self.failures) + " PROBE AT: " + utcToLocal(self.probeTime).strftime("%H:%M:%S"))
         
-class nhlInfo:
-    def __init__(self):
-        self.enabled=False
-        self.favoriteTeams=''
+# ESPN sport and league of each league the scoreboard knows, by config section. Other leagues can be added to the
+# config with their own sport and league keys.
+LEAGUES = {
+    'NHL': ('hockey', 'nhl'),
+    'NBA': ('basketball', 'nba'),
+    'WNBA': ('basketball', 'wnba'),
+    'MLB': ('baseball', 'mlb'),
+    'NFL': ('football', 'nfl'),
+    'NCAAF': ('football', 'college-football'),
+    'NCAAM': ('basketball', 'mens-college-basketball')
+}
+
+class leagueProvider:
+    """One league on the scoreboard: its ESPN endpoints, how its events are parsed, where its logos and goal animations
+    are and how often it's polled.
+
+    Each league keeps its own teams, games, poll schedule and circuit breaker, and is fetched by its own worker, so a
+    league with a slow or broken feed never holds up the others.
+    """
+    def __init__(self, key, sport, league, logoDir, goalDir, scheduler=None, parser=None):
+        self.key=key # Config section, like NHL. Also names the league in the logs and its cache files.
+        self.scoreboardUrl="https://site.api.espn.com/apis/site/v2/sports/" + sport + "/" + league + "/scoreboard"
+        self.teamsUrl="https://site.api.espn.com/apis/site/v2/sports/" + sport + "/" + league + "/teams"
+        self.logoDir=logoDir # Relative to sbPath, like the paths in Team.
+        self.goalDir=goalDir
+        self.parser=parser or parseEvent
+        self.scheduler=scheduler or pollScheduler(name=key)
+        self.breaker=circuitBreaker(name=key)
+        self.cacheData=cacheInfo()
+        self.favoriteTeams=set()
+        self.registry=None # Loaded by its worker, the first fetch can need the API.
+        self.store=None
+        self.lastGood=None # When games were last fetched successfully.
+        self.fetchTime=0
+        self.parseTime=0
+
+    @classmethod
+    def fromConfig(cls, config, key):
+        """Builds the provider for a league's config section."""
+        sport, league = LEAGUES.get(key, (None, None))
+        if key=='NHL':
+            logoDir, goalDir = "assets/images/team logos/png/", "assets/images/goal/"
+        else:
+            logoDir, goalDir = "assets/images/" + key.lower() + "/logos/", "assets/images/" + key.lower() + "/goal/"
+        scheduler=pollScheduler(config.getint(key, 'liveInterval', fallback=10), config.getint(key, 'intermissionInterval', fallback=60), name=key)
+        provider=cls(key, config.get(key, 'sport', fallback=sport), config.get(key, 'league', fallback=league),
+                     config.get(key, 'logoDir', fallback=logoDir), config.get(key, 'goalDir', fallback=goalDir), scheduler)
+        provider.setFavoriteTeams(config.get(key, 'favoriteTeams', fallback=''))
+        provider.store=gameStore(provider.cachePath("games"))
+        return provider
+
+    def cachePath(self, name):
+        """Returns the path of one of the league's cache files. The NHL keeps the names it had before other leagues."""
+        return sbPath + "cache/" + name + ("" if self.key=='NHL' else "-" + self.key.lower()) + ".json"
+
+    def teamSources(self):
+        """Paths the league's teamRegistry is built from, relative to sbPath."""
+        return (relativePath(self.cachePath("teams")), self.logoDir.rstrip('/'), self.goalDir.rstrip('/'))
+
+    def setFavoriteTeams(self, favoriteTeams):
+        """Sets the favorite teams from a list of abbreviations separated by commas or spaces."""
+        self.favoriteTeams=set(favoriteTeams.replace(',',' ').upper().split())
 
-    def isEnabled(self):
-        return self.enabled
-    
     def isFavoriteTeam(self,team):
-        return self.favoriteTeams.__contains__(team)
+        return team in self.favoriteTeams
+
+    def stats(self):
+        return ("LEAGUE " + self.key + " - GAMES: " + str(len(self.cacheData.games or ())) + " STATE: " + self.scheduler.state
+                + " FETCH: " + str(round(self.fetchTime*1000)) + "ms PARSE: " + str(round(self.parseTime*1000)) + "ms")
+
+class Team(NamedTuple):
+    """A team in the teamRegistry. Paths are relative to sbPath, and goalGif is empty if the team has no goal animation."""
+    teamId: str # ESPN team id.
+    abbreviation: str
+    name: str
+    shortName: str
+    color: str # Hex RGB, no leading #.
+    alternateColor: str
+    logo: str
+    goalGif: str
+
+class teamRegistry:
+    """Teams indexed by abbreviation and by ESPN team id.
+
+    Built once from the ESPN teams JSON, with the logo and goal animation for each team found up front, then saved as a
+    compact file that later starts load directly. The compact file records the modification times of the teams JSON
+    and the asset folders, and is rebuilt when any of them change.
+    """
+    def __init__(self, teams=()):
+        teams=list(teams)
+        self.byAbbreviation={team.abbreviation: team for team in teams}
+        self.byId={team.teamId: team for team in teams}
+
+    def get(self, abbreviation):
+        """Returns the Team for an abbreviation, or None if there isn't one."""
+        return self.byAbbreviation.get(abbreviation)
+
+    def getById(self, teamId):
+        """Returns the Team for an ESPN team id, or None if there isn't one."""
+        return self.byId.get(teamId)
+
+    def __iter__(self):
+        return iter(self.byAbbreviation.values())
+
+    def __len__(self):
+        return len(self.byAbbreviation)
+
+    @staticmethod
+    def sources(paths):
+        """Modification times of everything the registry is built from, to tell when a saved copy is stale.
+
+        Args:
+            paths (list of strings): The teams JSON and the asset folders, relative to sbPath.
+        """
+        return [os.stat(sbPath + path).st_mtime_ns if exists(sbPath + path) else 0 for path in paths]
+
+    @classmethod
+    def fromEspn(cls, teamsJson, logoDir="assets/images/team logos/png/", goalDir="assets/images/goal/"):
+        """Builds the registry from the ESPN teams JSON, with the logos and goal animations in the given folders."""
+        teams=[]
+        for team in teamsJson['sports'][0]['leagues'][0]['teams']:
+            team=team['team']
+            logo=logoDir + team['abbreviation'] + ".png"
+            goalGif=goalDir + team['abbreviation'] + ".gif"
+            teams.append(Team(
+                teamId = team['id'],
+                abbreviation = team['abbreviation'],
+                name = team['displayName'],
+                shortName = team.get('shortDisplayName', team['displayName']),
+                color = team.get('color', 'ffffff'),
+                alternateColor = team.get('alternateColor', '000000'),
+                logo = logo,
+                goalGif = goalGif if exists(sbPath + goalGif) else ''
+            ))
+        return cls(teams)
+
+    @classmethod
+    def load(cls, path, sourcePaths):
+        """Loads a saved registry. Returns None if there isn't one or it's stale."""
+        try:
+            saved=json.loads(cacheFiles.read(path) or b'{}')
+        except ValueError:
+            return None
+        if saved.get('sources')!=cls.sources(sourcePaths):
+            return None
+        return cls(Team(*team) for team in saved['teams'])
+
+    def save(self, path, sourcePaths):
+        """Saves the registry as compact JSON, one array per team."""
+        saved={'sources': self.sources(sourcePaths), 'teams': [list(team) for team in self]}
+        cacheFiles.write(path, json.dumps(saved, ensure_ascii=False, separators=(',',':')).encode('utf-8'))
+
+class GameStatus(Enum):
+    """Status of a game, as named by the ESPN API. Statuses this doesn't know about come back as UNKNOWN."""
+    SCHEDULED="STATUS_SCHEDULED"
+    IN_PROGRESS="STATUS_IN_PROGRESS"
+    END_PERIOD="STATUS_END_PERIOD"
+    HALFTIME="STATUS_HALFTIME"
+    FINAL="STATUS_FINAL"
+    POSTPONED="STATUS_POSTPONED"
+    DELAYED="STATUS_DELAYED"
+    CANCELED="STATUS_CANCELED"
+    UNKNOWN="STATUS_UNKNOWN"
+
+    @classmethod
+    def _missing_(cls, value):
+        return cls.UNKNOWN
+
+class Game(NamedTuple):
+    """All the information needed to display one game. Immutable, with every timestamp parsed once when it's built."""
+    gameId: str
+    date: datetime # Local time.
+    homeTeam: str
+    homeAbbreviation: str
+    awayTeam: str
+    awayAbbreviation: str
+    homeScore: int
+    awayScore: int
+    startTimeUtc: datetime
+    startTimeLocal: datetime
+    status: GameStatus
+    detailedStatus: str
+    periodNumber: int
+    periodName: str
+    periodTimeRemaining: str
+    recap: str
+    league: str = "NHL" # Key of the leagueProvider the game came from.
+
+class GameEventType(Enum):
+    """Kinds of change gameTracker reports."""
+    GAME_START=1
+    GOAL=2
+    PERIOD_START=3
+    PERIOD_END=4
+    FINAL=5
+
+class GameEvent(NamedTuple):
+    """A change in a game, emitted by gameTracker."""
+    type: GameEventType
+    game: Game
+    gameOld: Game
+    scoringTeam: str # For goals, the team that scored. home/away/both.
+
+class gameTracker:
+    """Turns each scoreboard pull into typed game events.
+
+    Games are keyed by Game ID, so games coming and going from the slate never misalign the comparison. Each raw
+    event is reduced to a small signature first, and only events whose signature changed are parsed and diffed.
+    Unchanged games reuse the Game record from the last pull.
+    """
+    def __init__(self):
+        self.games={}
+        self.signatures={}
+        self.subscribers={}
+        # Every league's worker reports to the one tracker.
+        self.lock=threading.Lock()
+
+    def subscribe(self, eventType, callback):
+        """Calls callback with a GameEvent whenever an event of eventType happens."""
+        self.subscribers.setdefault(eventType, []).append(callback)
+
+    def update(self, events, league="NHL", parser=None):
+        """Takes the events from a league's scoreboard pull. Returns the list of Game records, sorted by Game ID.
+
+        Args:
+            events (list): Events from the scoreboard JSON.
+            league (string, optional): Key of the league the events are from. Defaults to "NHL".
+            parser (function, optional): Builds a Game from an event and the league. Defaults to parseEvent.
+        """
+        with self.lock:
+            return self.updateLeague(events, league, parser or parseEvent)
+
+    def updateLeague(self, events, league, parser):
+        lastGames=self.games.get(league, {})
+        lastSignatures=self.signatures.get(league, {})
+        games={}
+        signatures={}
+        changes=[]
+        for event in events:
+            gameId=event['id']
+            status=event['status']
+            competitors=event['competitions'][0]['competitors']
+            signature=(status['type']['name'], status['period'], status['type']['shortDetail'], competitors[0]['score'], competitors[1]['score'])
+            signatures[gameId]=signature
+            if lastSignatures.get(gameId)==signature:
+                games[gameId]=lastGames[gameId]
+                continue
+            game=parser(event, league)
+            games[gameId]=game
+            # Games seen for the first time are the baseline, there's nothing to compare them to.
+            if gameId in lastGames:
+                changes.append((game, lastGames[gameId]))
+
+        self.games[league]=games
+        self.signatures[league]=signatures
+        for game, gameOld in changes:
+            for gameEvent in diffGames(game, gameOld):
+                for callback in self.subscribers.get(gameEvent.type, []):
+                    callback(gameEvent)
+
+        return sorted(games.values(), key=lambda game:game.gameId)
+
+    def current(self, game):
+        """Returns the newest record of a game, or the game itself if it's no longer on the slate."""
+        with self.lock:
+            return self.games.get(game.league, {}).get(game.gameId, game)
+
+def diffGames(game, gameOld):
+    """Returns the list of GameEvents between two versions of the same game."""
+    gameEvents=[]
+    if game.status==gameOld.status and game.periodNumber==gameOld.periodNumber and game.homeScore==gameOld.homeScore and game.awayScore==gameOld.awayScore:
+        return gameEvents
+
+    if gameOld.status==GameStatus.SCHEDULED and game.status not in (GameStatus.SCHEDULED, GameStatus.POSTPONED, GameStatus.CANCELED):
+        gameEvents.append(GameEvent(GameEventType.GAME_START, game, gameOld, "none"))
+    scoringTeam=checkGoalScorer(game, gameOld)
+    if scoringTeam!="none":
+        gameEvents.append(GameEvent(GameEventType.GOAL, game, gameOld, scoringTeam))
+    if game.status==GameStatus.END_PERIOD and gameOld.status!=GameStatus.END_PERIOD:
+        gameEvents.append(GameEvent(GameEventType.PERIOD_END, game, gameOld, "none"))
+    elif game.status==GameStatus.IN_PROGRESS and gameOld.status!=GameStatus.SCHEDULED and (game.periodNumber>gameOld.periodNumber or gameOld.status==GameStatus.END_PERIOD):
+        gameEvents.append(GameEvent(GameEventType.PERIOD_START, game, gameOld, "none"))
+    if game.status==GameStatus.FINAL and gameOld.status!=GameStatus.FINAL:
+        gameEvents.append(GameEvent(GameEventType.FINAL, game, gameOld, "none"))
+    return gameEvents
+
+class assetPack:
+    """Panel-ready logos, GIF frames and glyph masks, built ahead of time by packAssets.py and read from a memory map.
+
+    The pack is one file: a magic line, the length of a JSON index, the index, then the pixels of every image. Images
+    are stored as RGBA or L, which Pillow can wrap in place, so nothing is decoded, resized or even copied at start.
+    A pack is only used when it was built for this panel size from the assets as they are on disk now.
+    """
+    MAGIC=b"SBPACK2\n"
+
+    def __init__(self, mapped, index, base):
+        self.mapped=mapped
+        self.base=base
+        self.data=memoryview(mapped)
+        self.entries=index['entries']
+        self.hits=0
+
+    @classmethod
+    def open(cls, path, size):
+        """Maps a pack. Returns None if there isn't one, or it's for another panel size or stale."""
+        try:
+            with open(path, 'rb') as packFile:
+                if packFile.read(len(cls.MAGIC))!=cls.MAGIC:
+                    return None
+                indexLength=struct.unpack('<I', packFile.read(4))[0]
+                index=json.loads(packFile.read(indexLength))
+                if index['size']!=list(size) or index['sources']!=cls.sources(index['sources']):
+                    return None
+                mapped=mmap.mmap(packFile.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+        # Offsets in the index are from the end of the header.
+        return cls(mapped, index, len(cls.MAGIC)+4+indexLength)
+
+    @staticmethod
+    def sources(paths):
+        """Modification times of the source files a pack is built from, by path relative to sbPath."""
+        return {path: os.stat(sbPath + path).st_mtime_ns if exists(sbPath + path) else 0 for path in paths}
+
+    @staticmethod
+    def write(path, size, sources, entries):
+        """Writes a pack.
+
+        Args:
+            path (string): Where to write the pack.
+            size (tuple): Panel size the pack is for.
+            sources (list of strings): Files the pack was built from, relative to sbPath.
+            entries (dict): Lists of (Image, extra) by key. Extra is anything JSON can hold, like a frame duration.
+        """
+        entryIndex={}
+        blobs=[]
+        offset=0
+        for key, frames in entries.items():
+            entry=entryIndex[key]=[]
+            for frame, extra in frames:
+                if frame.mode!='L':
+                    frame=frame.convert('RGBA')
+                blobs.append(frame.tobytes())
+                entry.append([frame.mode, frame.size[0], frame.size[1], offset, extra])
+                offset+=len(blobs[-1])
+        index={'size': list(size), 'sources': assetPack.sources(sources), 'entries': entryIndex}
+        indexJson=json.dumps(index, separators=(',',':')).encode('utf-8')
+        header=assetPack.MAGIC + struct.pack('<I', len(indexJson)) + indexJson
+        tmpPath=path + ".tmp"
+        with open(tmpPath, 'wb') as packFile:
+            packFile.write(header)
+            for blob in blobs:
+                packFile.write(blob)
+        os.replace(tmpPath, path)
+
+    def frames(self, key):
+        """Returns a list of (Image, extra) for a key, or None if it isn't in the pack."""
+        entry=self.entries.get(key)
+        if entry is None:
+            return None
+        self.hits+=1
+        frames=[]
+        for mode, width, height, offset, extra in entry:
+            if width and height:
+                offset+=self.base
+                frame=Image.frombuffer(mode, (width, height), self.data[offset:offset+width*height*len(mode)], 'raw', mode, 0, 1)
+            else:
+                frame=Image.new(mode, (width, height))
+            frames.append((frame, extra))
+        return frames
+
+    @staticmethod
+    def logoKey(team, size, reverse, black, league="NHL"):
+        return "logo:" + league + ":" + team + ":" + str(size[0]) + "x" + str(size[1]) + ":" + str(reverse) + ":" + str(black)
+
+    @staticmethod
+    def gifKey(path, size):
+        return "gif:" + relativePath(path) + ":" + str(size[0]) + "x" + str(size[1])
+
+    @staticmethod
+    def glyphKey(font, char):
+        return "glyph:" + relativePath(font.path) + ":" + str(font.size) + ":" + str(ord(char))
+
+    def stats(self):
+        return "ASSET PACK - HITS: " + str(self.hits) + " ENTRIES: " + str(len(self.entries))
+
+def relativePath(path):
+    """Returns an asset path relative to sbPath."""
+    return path[len(sbPath):] if path.startswith(sbPath) else path
+
+class logoCache:
+    """Bounded LRU cache of logo tiles that are ready to paste onto the image.
+
+    Tiles are keyed by (team, size, fade direction, black level, league) and hold the final cropped, resized and faded RGB image,
+    so a rotation with unchanged teams does no file I/O and no image processing.
+    """
+    def __init__(self, maxSize=72, pack=None):
+        self.maxSize=maxSize
+        self.pack=pack
+        self.logos=OrderedDict()
+        self.hits=0
+        self.misses=0
+
+    def getLogo(self, team, size, reverse=None, black=255, league="NHL"):
+        """Returns the processed logo for a team, building it on a cache miss.
+
+        Args:
+            team (string): Team abbreviation, or "NHL" for the league logo.
+            size (tuple): Max width and height of the logo.
+            reverse (bool, optional): Fade direction passed to fadeImage. None leaves the logo unfaded.
+            black (int, optional): Black level passed to fadeImage.
+            league (string, optional): League the team is in. Abbreviations are only unique within a league.
+        """
+        key=(team,size,reverse,black,league)
+        logo=self.logos.get(key)
+        if logo is not None:
+            self.hits+=1
+            self.logos.move_to_end(key)
+            return logo
+
+        self.misses+=1
+        packed=self.pack.frames(assetPack.logoKey(*key)) if self.pack else None
+        if packed:
+            logo = packed[0][0]
+        elif not exists(logoPath(team, league)):
+            # A league without logos on disk still gets its scores shown.
+            logo = Image.new("RGB", (1,1))
+        else:
+            with Image.open(logoPath(team, league)) as source:
+                logo = cropImage(source)
+            logo.thumbnail(size)
+            if reverse is not None:
+                logo = fadeImage(logo,reverse,black)
+
+        self.logos[key]=logo
+        if len(self.logos)>self.maxSize:
+            self.logos.popitem(last=False)
+        return logo
+
+    def stats(self):
+        return "LOGO CACHE - HITS: " + str(self.hits) + " MISSES: " + str(self.misses) + " SIZE: " + str(len(self.logos))
+
+class gifCache:
+    """Decoded GIF frames held in memory, keyed by (path, size, mtime) and bounded by the bytes of frame data held.
+
+    With a disk path set, decoded frames are also written there as raw RGB so a restart can skip decoding.
+    """
+    def __init__(self, maxBytes=16*1024*1024, diskPath='', pack=None):
+        self.maxBytes=maxBytes
+        self.diskPath=diskPath
+        self.pack=pack
+        self.gifs=OrderedDict()
+        self.bytes=0
+        self.hits=0
+        self.misses=0
+
+    def getFrames(self, path, size):
+        """Returns a list of (frame, duration) tuples for a gif resized to size."""
+        size=tuple(size)
+        key=(path,size,os.path.getmtime(path))
+        frames=self.gifs.get(key)
+        if frames is not None:
+            self.hits+=1
+            self.gifs.move_to_end(key)
+            return frames
+
+        self.misses+=1
+        frames=self.pack.frames(assetPack.gifKey(path,size)) if self.pack else None
+        if frames is None:
+            frames=self.loadRaw(key)
+        if frames is None:
+            frames=get_frames(path,size)
+            self.saveRaw(key,frames)
+
+        self.gifs[key]=frames
+        self.bytes+=len(frames)*size[0]*size[1]*3
+        # Always keep the newest gif, even if it's larger than the cap on its own.
+        while self.bytes>self.maxBytes and len(self.gifs)>1:
+            (_,evictSize,_),evicted=self.gifs.popitem(last=False)
+            self.bytes-=len(evicted)*evictSize[0]*evictSize[1]*3
+        return frames
+
+    def rawPath(self, key):
+        name=hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.diskPath, name + ".raw")
+
+    def loadRaw(self, key):
+        """Reads frames from the raw store. Returns None if the store is disabled or has no usable copy."""
+        if not self.diskPath or not exists(self.rawPath(key)):
+            return None
+        try:
+            with open(self.rawPath(key), 'rb') as rawFile:
+                header=json.loads(rawFile.readline())
+                data=rawFile.read()
+        except (OSError, ValueError):
+            return None
+        if header['key']!=[key[0],list(key[1]),key[2]]:
+            return None
+        frameBytes=key[1][0]*key[1][1]*3
+        if len(data)!=frameBytes*len(header['durations']):
+            return None
+        return [(Image.frombytes('RGB', key[1], data[i*frameBytes:(i+1)*frameBytes]), duration) for i, duration in enumerate(header['durations'])]
+
+    def saveRaw(self, key, frames):
+        """Writes frames to the raw store as a one line JSON header followed by the RGB data of every frame."""
+        if not self.diskPath:
+            return
+        try:
+            os.makedirs(self.diskPath, exist_ok=True)
+            tmpPath=self.rawPath(key) + ".tmp"
+            with open(tmpPath, 'wb') as rawFile:
+                header={'key':[key[0],list(key[1]),key[2]], 'durations':[duration for _, duration in frames]}
+                rawFile.write(json.dumps(header).encode('utf-8') + b"\n")
+                for frame, _ in frames:
+                    rawFile.write(frame.tobytes())
+            os.replace(tmpPath, self.rawPath(key))
+            writes.add('gifs', os.path.getsize(self.rawPath(key)))
+        except OSError as e:
+            logger.error('Error %s', 'writing gif frame store', exc_info=e)
+
+    def stats(self):
+        return "GIF CACHE - HITS: " + str(self.hits) + " MISSES: " + str(self.misses) + " BYTES: " + str(self.bytes)
+
+class sceneCache:
+    """Fully composed game cards, so a card that hasn't changed costs a single paste per rotation.
+
+    Cards are keyed by everything that shows on them. Entries for a game are dropped when the tracker reports a
+    change to it, and the least recently used card goes once the cache is full. The tracker reports from the league
+    workers while the rotation reads, so every access is locked.
+    """
+    def __init__(self, maxSize=32):
+        self.maxSize=maxSize
+        self.scenes=OrderedDict()
+        self.lock=threading.Lock()
+        self.hits=0
+        self.misses=0
+
+    def key(self, game, scoringTeam, size):
+        # The day is part of the key so "Today" on scheduled games rolls over at midnight. The start time and date are
+        # drawn on scheduled games and can change without the tracker reporting anything.
+        return (game.gameId, game.awayScore, game.homeScore, game.periodName, game.periodTimeRemaining, game.status, game.startTimeLocal, game.date, scoringTeam, size, clock.now().date())
+
+    def get(self, key):
+        """Returns the (frame, goalData) stored for key, or None."""
+        with self.lock:
+            scene=self.scenes.get(key)
+            if scene is None:
+                self.misses+=1
+                return None
+            self.hits+=1
+            self.scenes.move_to_end(key)
+            return scene
+
+    def put(self, key, frame, goalData):
+        with self.lock:
+            self.scenes[key]=(frame, goalData)
+            if len(self.scenes)>self.maxSize:
+                self.scenes.popitem(last=False)
+
+    def invalidate(self, gameId):
+        """Drops every card stored for a game."""
+        with self.lock:
+            for key in [key for key in self.scenes if key[0]==gameId]:
+                del self.scenes[key]
+
+    def stats(self):
+        return "SCENE CACHE - HITS: " + str(self.hits) + " MISSES: " + str(self.misses) + " SIZE: " + str(len(self.scenes))
+
+class glyphAtlas:
+    """Draws text from cached glyph bitmaps instead of rasterizing it with FreeType on every frame.
+
+    Each (font, char) is rasterized once into an 'L' mask, and each (font, char, colour) gets a tile of its colour.
+    Text is drawn by pasting the tiles through the masks at the positions FreeType lays them out at, which gives the
+    same pixels as draw.text for the fonts and anchors the board uses. The layout of each string is cached too.
+    """
+    def __init__(self, maxTiles=512, maxLayouts=256, pack=None):
+        self.maxTiles=maxTiles
+        self.maxLayouts=maxLayouts
+        self.pack=pack
+        self.masks={}
+        self.tiles=OrderedDict()
+        self.layouts=OrderedDict()
+
+    def getMask(self, font, char):
+        """Returns the mask of a single glyph and its offset from the baseline origin."""
+        key=(font.path,font.size,char)
+        mask=self.masks.get(key)
+        packed=self.pack.frames(assetPack.glyphKey(font, char)) if mask is None and self.pack else None
+        if packed:
+            glyph, offset = packed[0]
+            mask=self.masks[key]=(glyph,tuple(offset))
+        elif mask is None:
+            left, top, right, bottom = font.getbbox(char, anchor="ls")
+            glyph=Image.new('L', (max(right-left,0), max(bottom-top,0)))
+            ImageDraw.Draw(glyph).text((-left,-top), char, font=font, fill=255, anchor="ls")
+            mask=self.masks[key]=(glyph,(left,top))
+        return mask
+
+    def getTile(self, font, char, colour):
+        key=(font.path,font.size,char,colour)
+        tile=self.tiles.get(key)
+        if tile is None:
+            glyph, _ = self.getMask(font, char)
+            tile=self.tiles[key]=Image.new('RGB', glyph.size, colour)
+            if len(self.tiles)>self.maxTiles:
+                self.tiles.popitem(last=False)
+        else:
+            self.tiles.move_to_end(key)
+        return tile
+
+    def getLayout(self, font, text, anchor):
+        """Returns where each glyph of text goes, relative to the anchor point."""
+        key=(font.path,font.size,text,anchor)
+        layout=self.layouts.get(key)
+        if layout is None:
+            # The baseline origin of the text, from where the anchor puts its bounding box.
+            anchorBox=font.getbbox(text, anchor=anchor)
+            originBox=font.getbbox(text, anchor="ls")
+            originX=anchorBox[0]-originBox[0]
+            originY=anchorBox[1]-originBox[1]
+            layout=[]
+            for i, char in enumerate(text):
+                glyph, (left, top) = self.getMask(font, char)
+                if glyph.size[0] and glyph.size[1]:
+                    layout.append((char, originX+int(font.getlength(text[:i]))+left, originY+top))
+            self.layouts[key]=layout
+            if len(self.layouts)>self.maxLayouts:
+                self.layouts.popitem(last=False)
+        else:
+            self.layouts.move_to_end(key)
+        return layout
+
+    def drawText(self, target, xy, text, font, fill, anchor=None):
+        """Draws text onto target like ImageDraw.text."""
+        if xy[0]!=int(xy[0]) or xy[1]!=int(xy[1]):
+            # Fractional positions are rendered with a sub-pixel shift that the cached glyphs don't have.
+            ImageDraw.Draw(target).text(xy, text, font=font, fill=fill, anchor=anchor)
+            return
+        colour=tuple(fill[:3])
+        for char, x, y in self.getLayout(font, text, anchor or "la"):
+            glyph, _ = self.getMask(font, char)
+            x+=int(xy[0])
+            y+=int(xy[1])
+            target.paste(self.getTile(font, char, colour), (x, y, x+glyph.size[0], y+glyph.size[1]), glyph)
+
+class virtualMatrixOptions:
+    """Stand-in for RGBMatrixOptions when running on the virtual matrix."""
+    def __init__(self):
+        self.rows=32
+        self.cols=32
+        self.chain_length=1
+        self.parallel=1
+        self.gpio_slowdown=1
+        self.hardware_mapping='regular'
+        self.drop_privileges=True
+        self.brightness=100
+
+class virtualFrame(NamedTuple):
+    """A frame shown on the virtual matrix."""
+    timestamp: float # clock.time() when the frame went up.
+    brightness: int
+    data: bytes # Raw RGB, before brightness is applied.
+
+class virtualCanvas:
+    """In-memory stand-in for FrameCanvas."""
+    def __init__(self, width, height):
+        self.width=width
+        self.height=height
+        self.brightness=100
+        self.pixels=Image.new("RGB", (width, height))
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True, rect=None):
+        if image.mode not in ("RGB", "RGBA"):
+            raise Exception("Currently, only RGB and RGBA modes are supported for SetImage().")
+        if rect is not None:
+            x, y, width, height = rect
+            image = image.crop((x, y, x+width, y+height))
+            offset_x, offset_y = offset_x+x, offset_y+y
+        self.pixels.paste(image.convert("RGB"), (offset_x, offset_y))
+
+    def SetBuffer(self, buffer, width, height, offset_x=0, offset_y=0, channels=3, stride=0, rect=None):
+        mode = {3: "RGB", 4: "RGBA"}[channels]
+        image = Image.frombuffer(mode, (width, height), bytes(memoryview(buffer).cast('B')), "raw", mode, stride, 1)
+        self.SetImage(image, offset_x, offset_y, True, rect)
+
+    def SetPixel(self, x, y, red, green, blue):
+        if 0<=x<self.width and 0<=y<self.height:
+            self.pixels.putpixel((x, y), (red, green, blue))
+
+    def Fill(self, red, green, blue):
+        self.pixels.paste((red, green, blue), (0, 0, self.width, self.height))
+
+    def Clear(self):
+        self.Fill(0, 0, 0)
+
+class virtualMatrix(virtualCanvas):
+    """Headless stand-in for RGBMatrix, for running and profiling without LED hardware.
+
+    Each frame that goes up is recorded with a timestamp into an in-memory ring buffer, and optionally written as a
+    PNG or appended to a raw frame file. SwapOnVSync blocks until the next refresh at refreshHz like the real
+    library does, so frame timing is close to what the panel gives.
+    """
+    def __init__(self, options, refreshHz=120, ringSize=600, pngPath='', rawPath=''):
+        super().__init__(options.cols*options.chain_length, options.rows*options.parallel)
+        self.refreshHz=refreshHz
+        self.frames=deque(maxlen=ringSize)
+        self.frameCount=0
+        self.pngPath=pngPath
+        self.rawFile=None
+        self.start=clock.monotonic()
+        if pngPath:
+            os.makedirs(pngPath, exist_ok=True)
+        if rawPath:
+            # Raw frames: a header with the size, then a timestamp, brightness and RGB data per frame.
+            self.rawFile=open(rawPath, 'wb')
+            self.rawFile.write(b"SBRAW1" + struct.pack('<HH', self.width, self.height))
+
+    def CreateFrameCanvas(self):
+        return virtualCanvas(self.width, self.height)
+
+    def SwapOnVSync(self, newFrame, framerate_fraction=1):
+        # Wait for the next refresh, or the next multiple of framerate_fraction refreshes.
+        period=framerate_fraction/self.refreshHz
+        elapsed=clock.monotonic()-self.start
+        clock.sleep(math.floor(elapsed/period+1)*period-elapsed)
+        previous=virtualCanvas(self.width, self.height)
+        previous.pixels, previous.brightness = self.pixels, self.brightness
+        self.pixels, self.brightness = newFrame.pixels, newFrame.brightness
+        self.record()
+        return previous
+
+    def SetImage(self, image, offset_x=0, offset_y=0, unsafe=True, rect=None):
+        super().SetImage(image, offset_x, offset_y, unsafe, rect)
+        self.record()
+
+    def record(self):
+        frame=virtualFrame(clock.time(), self.brightness, self.pixels.tobytes())
+        self.frames.append(frame)
+        self.frameCount+=1
+        if self.pngPath:
+            # Scale by brightness so the PNG looks like the panel.
+            shown=self.pixels.point(lambda level: level*frame.brightness//100)
+            shown.save(os.path.join(self.pngPath, "frame-" + str(self.frameCount).zfill(6) + ".png"))
+        if self.rawFile:
+            self.rawFile.write(struct.pack('<dB', frame.timestamp, frame.brightness) + frame.data)
+
+class frameOutput:
+    """Double buffered output to the matrix and the only path frames take to the panel.
+
+    Frames are written to an offscreen canvas and swapped in on vsync, so pixels are never written while the panel
+    is refreshing from them. SwapOnVSync hands back the previous canvas, so the same pair is reused forever.
+
+    Each canvas keeps the last frame written to it, so only the tiles that changed since are pushed. Changed tiles are
+    merged into rectangles and trimmed to the pixels that changed. When the changes cover more than fullPushArea of
+    the frame, come to more than maxRects rectangles, or the brightness changed, the whole frame is pushed instead.
+    """
+    def __init__(self, matrix, width, height, tileSize=(16,8), fullPushArea=0.5, maxRects=8):
+        self.matrix=matrix
+        self.canvas=matrix.CreateFrameCanvas()
+        self.width=width
+        self.height=height
+        # Everything currently shown, so partial images can be drawn over it.
+        self.frame=Image.new("RGB", (width, height))
+        self.brightness=matrix.brightness
+        self.tileSize=tileSize
+        self.fullPushArea=fullPushArea
+        self.maxRects=maxRects
+        # The frame and brightness last written to each canvas of the pair, and which one is offscreen.
+        self.shadows=[None, None]
+        self.back=0
+        self.changedLevels=[0]+[255]*255
+        self.framesFull=0
+        self.framesPartial=0
+        self.framesUnchanged=0
+        self.pixelsPushed=0
+        self.statsPixels=0
+        self.statsTime=clock.monotonic()
+
+    def show(self, frame, offset=(0,0)):
+        """Displays an image on the panel.
+
+        Args:
+            frame (Image): RGB image to display. Images smaller than the panel are drawn over what's already shown.
+            offset (tuple, optional): Where to place the top left corner of the image. Defaults to (0,0).
+        """
+        self.frame.paste(frame, (int(offset[0]), int(offset[1])))
+        # Brightness is applied as pixels are set, so it has to be set on the canvas before the image.
+        self.canvas.brightness=self.brightness
+        shadow=self.shadows[self.back]
+        rects=self.damage(shadow[0]) if shadow is not None and shadow[1]==self.brightness else None
+        start=time.perf_counter()
+        if rects is None:
+            self.canvas.SetImage(self.frame)
+            metrics.observe('scoreboard_setimage_seconds', time.perf_counter()-start, push="full")
+            self.pixelsPushed+=self.width*self.height
+            self.framesFull+=1
+        elif rects:
+            for rect in rects:
+                self.canvas.SetImage(self.frame, rect=rect)
+                self.pixelsPushed+=rect[2]*rect[3]
+            metrics.observe('scoreboard_setimage_seconds', time.perf_counter()-start, push="partial")
+            self.framesPartial+=1
+        else:
+            self.framesUnchanged+=1
+        self.shadows[self.back]=(self.frame.copy(), self.brightness)
+        self.canvas=self.matrix.SwapOnVSync(self.canvas)
+        self.back^=1
+
+    def damage(self, shadow):
+        """Returns the rectangles where the frame differs from shadow as (x, y, width, height), or None when pushing the
+        whole frame is cheaper."""
+        diff=ImageChops.difference(self.frame, shadow)
+        if diff.getbbox() is None:
+            return []
+        # Any change in any channel marks the pixel, so a tile with one changed pixel can't average out to nothing.
+        red, green, blue = diff.split()
+        changed=ImageChops.lighter(ImageChops.lighter(red, green), blue).point(self.changedLevels)
+        tileWidth, tileHeight = self.tileSize
+        tiles=changed.reduce(self.tileSize)
+        columns, rows = tiles.size
+        dirty=tiles.tobytes()
+
+        # Merge runs of changed tiles along each row, then grow runs with the same span down through the rows below.
+        rects=[]
+        openSpans={}
+        for row in range(rows):
+            spans={}
+            column=0
+            while column<columns:
+                if not dirty[row*columns+column]:
+                    column+=1
+                    continue
+                start=column
+                while column<columns and dirty[row*columns+column]:
+                    column+=1
+                rect=openSpans.get((start, column))
+                if rect is None:
+                    rect=[start, row, column, row+1]
+                    rects.append(rect)
+                rect[3]=row+1
+                spans[(start, column)]=rect
+            openSpans=spans
+
+        # From tiles to pixels, trimmed to what changed inside them.
+        boxes=[]
+        area=0
+        for left, top, right, bottom in rects:
+            box=(left*tileWidth, top*tileHeight, min(right*tileWidth, self.width), min(bottom*tileHeight, self.height))
+            x0, y0, x1, y1 = changed.crop(box).getbbox()
+            boxes.append((box[0]+x0, box[1]+y0, x1-x0, y1-y0))
+            area+=(x1-x0)*(y1-y0)
+        if len(boxes)>self.maxRects or area>self.fullPushArea*self.width*self.height:
+            return None
+        return boxes
+
+    def stats(self):
+        now=clock.monotonic()
+        rate=(self.pixelsPushed-self.statsPixels)/max(now-self.statsTime, 0.001)
+        self.statsPixels=self.pixelsPushed
+        self.statsTime=now
+        return "OUTPUT - FULL: " + str(self.framesFull) + " PARTIAL: " + str(self.framesPartial) + " UNCHANGED: " + str(self.framesUnchanged) + " PIXELS/S: " + str(round(rate))
+
+class animationTimeline:
+    """Plays animations against absolute deadlines instead of chains of sleeps.
+
+    Every frame is due at a fixed time from the start of the animation, so time spent rendering and pushing a frame
+    comes out of the wait for the next one. When rendering falls behind, frames that are already late are dropped
+    so the animation still ends on time. The last frame is never dropped since it's the state the animation leaves.
+    """
+    # How far past its due time a frame can be shown and still count as on time. The first frame is always due now.
+    tolerance=0.005
+
+    def __init__(self):
+        self.framesShown=0
+        self.framesDropped=0
+        self.missedDeadlines=0
+
+    def play(self, name, frameTimes, renderFrame, duration=None):
+        """Plays an animation and blocks until it's done.
+
+        Args:
+            name (string): Name of the animation, used when reporting missed deadlines.
+            frameTimes (list of floats): When each frame is due, in seconds from the start of the animation.
+            renderFrame (function): Called with the index of each frame to draw and show.
+            duration (float, optional): Total length of the animation. Defaults to when the last frame is due.
+        """
+        start=clock.monotonic()
+        count=len(frameTimes)
+        dropped=0
+        missed=0
+        shown=0
+        frame=0
+        while frame<count:
+            delay=start+frameTimes[frame]-clock.monotonic()
+            if delay>0:
+                clock.sleep(delay)
+            else:
+                # Behind schedule. Jump to the newest frame that's already due.
+                if delay<-self.tolerance:
+                    missed+=1
+                now=clock.monotonic()
+                while frame+1<count and start+frameTimes[frame+1]<=now:
+                    frame+=1
+                    dropped+=1
+            renderFrame(frame)
+            if shown==0:
+                firstShown=clock.monotonic()
+            shown+=1
+            self.framesShown+=1
+            frame+=1
+        if shown>1:
+            # Counted between the first and last frames, since the animation's own length doesn't change the rate.
+            elapsed=clock.monotonic()-firstShown
+            metrics.observe('scoreboard_animation_fps', (shown-1)/elapsed if elapsed>0 else 0, animation=name)
+
+        if duration is not None:
+            delay=start+duration-clock.monotonic()
+            if delay>0:
+                clock.sleep(delay)
+
+        self.framesDropped+=dropped
+        self.missedDeadlines+=missed
+        if dropped:
+            metrics.inc('scoreboard_animation_frames_dropped_total', dropped, animation=name)
+            logger.info("ANIMATION " + name + " - FRAMES: " + str(count) + " DROPPED: " + str(dropped) + " LATE: " + str(missed))
+
+    def playFixed(self, name, frameCount, fps, renderFrame):
+        """Plays frameCount frames at a fixed frame rate."""
+        self.play(name, [frame/fps for frame in range(frameCount)], renderFrame, frameCount/fps)
+
+    def stats(self):
+        return "ANIMATION - FRAMES: " + str(self.framesShown) + " DROPPED: " + str(self.framesDropped) + " LATE: " + str(self.missedDeadlines)
+
+def fadeBrightness(levels):
+    """Steps the brightness of the displayed image through levels at fadeFps."""
+    def renderFrame(frame):
+        output.brightness = levels[frame]
+        output.show(image)
+    timeline.playFixed("FADE", len(levels), fadeFps, renderFrame)
 
 def get_frames(path,size):
-    """Returns an iterable of gif frames."""
+    """Decodes a gif. Returns a list of (frame, duration) tuples with each frame converted to RGB and resized."""
     frames = []
     with Image.open(path) as gif:
         for frame in ImageSequence.Iterator(gif):
+            duration = frame.info.get('duration', 100)
             frame = frame.convert('RGB').resize(size)
-            frames.append(frame)
+            frames.append((frame, duration))
         return frames
 
 
 def display_gif(path,number_of_loops,location,size=(32,32),speed=50):
-    loops_done=0    
-    while True:
-        for frame in get_frames(path,size):
-            matrix.SetImage(frame, location[0])
-            if speed=='gif':
-                duration=frame.info['duration']
-            else:
-                duration=speed
-            time.sleep(duration/1000)
-        loops_done+=1
-        if loops_done>=number_of_loops:
-            return
-
-def getTeamData():
-    """Get team names and abreviations from the NHL API, return information as a list of dictionaries.
-
+    frames=gifs.getFrames(path,size)
+    frames=frames*number_of_loops
+
+    # Frames are due back to back, each lasting its own duration or the fixed speed.
+    frameTimes=[]
+    elapsed=0
+    for frame, frameDuration in frames:
+        frameTimes.append(elapsed/1000)
+        elapsed+=frameDuration if speed=='gif' else speed
+
+    def renderFrame(frame):
+        output.show(frames[frame][0], (location[0], 0))
+    timeline.play("GIF", frameTimes, renderFrame, elapsed/1000)
+
+class gameSnapshot(NamedTuple):
+    """One published result of the game data worker. A tuple of Game records, never modified once published."""
+    games: tuple
+    fetched: datetime # When the games were last fetched successfully.
+    networkError: bool
+    networkState: str # ok, retrying, down (circuit open, serving the last good games) or probing.
+
+class gameDataWorker(threading.Thread):
+    """Fetches and parses game data in a background thread, publishing each result as an immutable gameSnapshot.
+
+    The render loop picks up the latest snapshot whenever it wants one and never waits on the network.
+    """
+    def __init__(self, provider, updated=None):
+        super().__init__(name="gameData-" + provider.key, daemon=True)
+        self.provider=provider
+        self.cacheData=provider.cacheData
+        self.scheduler=provider.scheduler
+        self.breaker=provider.breaker
+        self.lastGood=None
+        self.snapshot=None
+        # Workers for several leagues can share one condition, so a single wait wakes on any of them.
+        self.updated=updated or threading.Condition()
+        self.lock=self.updated
+        self.wake=threading.Event()
+
+    def run(self):
+        while True:
+            # Sleep until the scheduler says a poll is due, or a refresh is requested.
+            self.wake.wait(clock.timeout(self.scheduler.secondsUntilWake()))
+            self.wake.clear()
+            if self.scheduler.secondsUntilWake()>0:
+                continue
+            if not self.breaker.allowRequest():
+                # The upstream is down. Don't touch the network until the breaker lets a probe through.
+                self.scheduler.wakeAt(self.breaker.probeTime)
+                continue
+            try:
+                if self.provider.registry is None:
+                    self.provider.registry = getTeamData(self.provider)
+                games = getGameData(self.provider)
+                self.breaker.recordSuccess()
+                self.scheduler.schedule(games)
+                self.lastGood=self.provider.lastGood=clock.now()
+                self.publish(tuple(games), False)
+            except requests.RequestException as e:
+                # The network going down is expected now and then, a traceback wouldn't say more than the type.
+                logger.error('Error %s', 'fetching ' + self.provider.key + ' game data: ' + type(e).__name__)
+                self.failed()
+            except Exception as e:
+                logger.error('Error %s', 'fetching ' + self.provider.key + ' game data', exc_info=e)
+                self.failed()
+
+    def failed(self):
+        """Backs off after a failed fetch and republishes the last good games with the network error."""
+        metrics.inc('scoreboard_fetch_failures_total', league=self.provider.key)
+        self.breaker.recordFailure()
+        if self.breaker.state=="open":
+            self.scheduler.wakeAt(self.breaker.probeTime)
+        else:
+            self.scheduler.failed()
+        # Keep serving the last good games.
+        if self.snapshot:
+            self.publish(self.snapshot.games, True)
+        else:
+            self.publish(tuple(self.cacheData.games or ()), True)
+
+    def publish(self, games, networkError):
+        if not networkError:
+            networkState="ok"
+        elif self.breaker.state=="open":
+            networkState="down"
+        elif self.breaker.state=="half-open":
+            networkState="probing"
+        else:
+            networkState="retrying"
+        with self.lock:
+            self.snapshot=gameSnapshot(games, self.lastGood, networkError, networkState)
+            self.updated.notify_all()
+
+    def latest(self):
+        """Returns the newest snapshot, or None if nothing has been fetched yet."""
+        return self.snapshot
+
+    def waitForUpdate(self, timeout):
+        """Blocks until a new snapshot is published or timeout seconds pass. Returns the latest snapshot."""
+        with self.lock:
+            self.updated.wait(clock.timeout(timeout))
+            return self.snapshot
+
+    def refresh(self):
+        """Asks the worker to pull fresh data from the API now."""
+        self.scheduler.refresh()
+        self.wake.set()
+
+class gameFeed:
+    """The game data workers of every enabled league, seen as one worker.
+
+    Each league is fetched by its own worker on its own schedule. Their snapshots are merged in league order into one
+    snapshot for the rotation, with the network status of the league worst off. A league that hasn't published yet
+    is left out rather than waited for.
+    """
+    def __init__(self, providers):
+        self.updated=threading.Condition()
+        self.workers=[gameDataWorker(provider, self.updated) for provider in providers]
+
+    def start(self):
+        for worker in self.workers:
+            worker.start()
+
+    def latest(self):
+        """Returns the merged snapshot, or None if no league has published yet."""
+        snapshots=[worker.snapshot for worker in self.workers if worker.snapshot is not None]
+        if not snapshots:
+            return None
+        games=tuple(game for snapshot in snapshots for game in snapshot.games)
+        failing=[snapshot for snapshot in snapshots if snapshot.networkError]
+        if not failing:
+            return gameSnapshot(games, min(snapshot.fetched for snapshot in snapshots), False, "ok")
+        worst=max(failing, key=lambda snapshot: ("retrying", "probing", "down").index(snapshot.networkState))
+        return gameSnapshot(games, worst.fetched, True, worst.networkState)
+
+    def waitForUpdate(self, timeout):
+        """Blocks until any league publishes or timeout seconds pass. Returns the merged snapshot."""
+        with self.updated:
+            self.updated.wait(clock.timeout(timeout))
+        return self.latest()
+
+    def refresh(self):
+        """Asks every league for fresh data now."""
+        for worker in self.workers:
+            worker.refresh()
+
+    def secondsUntilWake(self):
+        """Seconds until the next league is due a poll."""
+        return min((worker.scheduler.secondsUntilWake() for worker in self.workers), default=0)
+
+class httpClient:
+    """Shared HTTP client for the ESPN endpoints.
+
+    Requests go through one session with a pool of keep-alive connections and bounded connect/read timeouts.
+    Responses are revalidated with ETag and If-Modified-Since, so an unchanged payload comes back as an empty 304.
+    """
+    def __init__(self, connectTimeout=3.05, readTimeout=10, poolSize=4):
+        self.session=requests.Session()
+        adapter=requests.adapters.HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.timeout=(connectTimeout, readTimeout)
+        self.validators={}
+        self.requests=0
+        self.notModified=0
+        self.bytes=0
+        self.lock=threading.Lock() # Every league's worker shares the client.
+
+    def getJson(self, url, conditional=True):
+        """Returns the parsed JSON body of url, or None if it hasn't changed since the last request for it.
+
+        Args:
+            url (string): URL to request.
+            conditional (bool, optional): Send the validators from the last response. Defaults to True.
+        """
+        headers={}
+        if conditional and url in self.validators:
+            etag, lastModified = self.validators[url]
+            if etag:
+                headers['If-None-Match']=etag
+            if lastModified:
+                headers['If-Modified-Since']=lastModified
+
+        # Labelled by the last two parts of the path, like nhl/scoreboard.
+        endpoint='/'.join(url.split('?')[0].rstrip('/').split('/')[-2:])
+        start=time.monotonic()
+        response=self.session.get(url, headers=headers, timeout=self.timeout)
+        latency=time.monotonic()-start
+        size=len(response.content)
+        with self.lock:
+            self.requests+=1
+            self.bytes+=size
+        metrics.observe('scoreboard_http_request_seconds', latency, endpoint=endpoint)
+        metrics.inc('scoreboard_http_requests_total', endpoint=endpoint, status=str(response.status_code))
+        metrics.inc('scoreboard_http_response_bytes_total', size, endpoint=endpoint)
+        logger.info("HTTP GET " + url + " - STATUS: " + str(response.status_code) + " LATENCY: " + str(round(latency*1000)) + "ms BYTES: " + str(size))
+
+        if response.status_code==304:
+            with self.lock:
+                self.notModified+=1
+            return None
+        response.raise_for_status()
+        self.validators[url]=(response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response.json()
+
+def getTeamData(provider):
+    """Get a league's team names, abreviations, colours and assets, return them as a teamRegistry.
+
+    The compact registry saved by the last start is used when it's current. Otherwise it's built from the ESPN teams
+    JSON, from the cache file or the API, and saved for next time.
+    Args:
+        provider (leagueProvider): The league to get the teams of.
     Returns:
-        teams (list of dictionaries): Each dict contains the longform name and abbreviation of a single NHL team.
+        teams (teamRegistry): Every team in the league, looked up by abbreviation or ESPN id.
     """
-    
-    # Call the NHL Teams API. Store as a JSON object.
+    teams = teamRegistry.load(provider.cachePath("teams.compact"), provider.teamSources())
+    if teams is not None:
+        return teams
+
+    # Call the Teams API. Store as a JSON object.
     # check for cache file and use that first
-    with open(sbPath + "cache/teams.json", 'r+', encoding='utf-8') as teamsJsonFile:
-        if teamsJsonFile.read(1):            
-            teamsJsonFile.seek(0)
-            teamsJson = json.load(teamsJsonFile)
-        else:            
-            teamsResponse = requests.get(url="https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/teams")
-            teamsJson = teamsResponse.json()
-            json.dump(teamsJson, teamsJsonFile, ensure_ascii=False, indent=4)
-    teamsJsonFile.close()
-    # Decalare an empty list to hold the team dicts.
-    teams = []
-
-    # For each team, build a dict recording it's name and abbreviation. Append this to the end of the teams list.
-    for team in teamsJson['sports'][0]['leagues'][0]['teams']:               
-        teamDict = {
-                'Team Name': team['team']['displayName'],
-                'Team Abbreviation': team['team']['abbreviation']
-        }
-        # Append dict to the end of the teams list.
-        teams.append(teamDict)
+    path = provider.cachePath("teams")
+    try:
+        teamsJson = json.loads(cacheFiles.read(path) or b'null')
+    except ValueError:
+        teamsJson = None
+    if not teamsJson:
+        teamsJson = espn.getJson(provider.teamsUrl, False)
+        cacheFiles.write(path, json.dumps(teamsJson, ensure_ascii=False, separators=(',',':')).encode('utf-8'))
+
+    teams = teamRegistry.fromEspn(teamsJson, provider.logoDir, provider.goalDir)
+    teams.save(provider.cachePath("teams.compact"), provider.teamSources())
+    logger.info("TEAM REGISTRY BUILT " + provider.key + " - TEAMS: " + str(len(teams)))
     return teams
 
-def getGameData(teams,cacheData):
-    """Get game data for all of todays games from the NHL API, returns games as a list of dictionaries.
+class writeMeter:
+    """Counts the bytes the scoreboard writes, by what wrote them, to report the write load on the SD card.
+
+    The process total from /proc/self/io is reported alongside, since it also counts writes that aren't metered,
+    and only bytes that reach the block device, not ones overwritten while still in the page cache.
+    """
+    def __init__(self):
+        self.lock=threading.Lock()
+        self.totals={}
+        self.lastReport=(time.monotonic(), {}, self.processBytes())
+
+    def add(self, kind, size):
+        with self.lock:
+            self.totals[kind]=self.totals.get(kind, 0)+size
+
+    def processBytes(self):
+        """Bytes this process has sent to storage, or None where /proc/self/io isn't available."""
+        try:
+            with open('/proc/self/io') as ioFile:
+                for line in ioFile:
+                    if line.startswith('write_bytes:'):
+                        return int(line.split()[1])
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def report(self):
+        """Returns the bytes written per hour since the last report, and starts a new period."""
+        now=time.monotonic()
+        with self.lock:
+            totals=dict(self.totals)
+        processBytes=self.processBytes()
+        since, lastTotals, lastProcess = self.lastReport
+        self.lastReport=(now, totals, processBytes)
+        hours=max(now-since, 1)/3600
+        line="WRITES PER HOUR -"
+        for kind in sorted(totals):
+            line+=" " + kind.upper() + ": " + str(round((totals[kind]-lastTotals.get(kind, 0))/hours/1024)) + "KB"
+        if processBytes is not None and lastProcess is not None:
+            line+=" PROCESS: " + str(round((processBytes-lastProcess)/hours/1024)) + "KB"
+        return line
+
+writes = writeMeter()
+
+class cacheWriter(threading.Thread):
+    """Writes cache files in the background, coalescing the writes to each one.
+
+    A file is written at most once every interval seconds. Only the newest contents queued in that time are written,
+    and not at all if they're the same as what's already there. Contents can be queued as a function, so they're only
+    serialized when they're written. Files are written to a temp file and renamed, so they're never half written.
+
+    In tmpfs mode cache files are kept under tmpfsPath instead of next to the scoreboard, seeded from the copies on the
+    card the first time they're read. In ram mode nothing is written, the newest contents are kept in memory. Either
+    way the SD card sees no cache writes, at the cost of a cold cache after a reboot.
+    """
+    def __init__(self, mode='disk', tmpfsPath='/dev/shm/scoreboard', interval=60, reportInterval=3600):
+        super().__init__(name="cacheWriter", daemon=True)
+        self.mode=mode
+        self.tmpfsPath=tmpfsPath
+        self.interval=interval
+        self.reportInterval=reportInterval
+        self.lock=threading.Lock()
+        self.dirty=threading.Event()
+        self.pending={} # Path to newest contents, bytes or a function returning bytes.
+        self.memory={} # Path to the contents last written, or kept in ram mode.
+        self.digests={}
+        self.lastWrite={}
+        self.kinds={}
+        self.writes=0
+        self.skipped=0
+
+    def locate(self, path):
+        """Returns where a cache file is kept in this mode."""
+        if self.mode=='tmpfs':
+            return os.path.join(self.tmpfsPath, os.path.normpath(relativePath(path)).lstrip(os.sep))
+        return path
+
+    def read(self, path):
+        """Returns the contents of a cache file as bytes, or None if there isn't one."""
+        with self.lock:
+            data=self.pending.get(path, self.memory.get(path))
+        if callable(data):
+            data=data()
+        if data is not None:
+            return data
+        for candidate in dict.fromkeys((self.locate(path), path)):
+            try:
+                with open(candidate, 'rb') as cacheFile:
+                    return cacheFile.read()
+            except OSError:
+                continue
+        return None
+
+    def write(self, path, data, kind='cache'):
+        """Queues contents for a cache file, replacing any not written yet.
+
+        Args:
+            path (string): Path of the file.
+            data (bytes or function): The contents, or a function that returns them when it's time to write.
+            kind (string, optional): What the bytes are metered as in the writeMeter. Defaults to "cache".
+        """
+        with self.lock:
+            self.pending[path]=data
+            self.kinds[path]=kind
+        self.dirty.set()
+
+    def run(self):
+        nextReport=clock.monotonic()+self.reportInterval
+        while True:
+            now=clock.monotonic()
+            with self.lock:
+                due=[self.lastWrite.get(path, 0)+self.interval for path in self.pending]
+            wait=min(due+[nextReport])-now
+            if wait>0:
+                self.dirty.wait(clock.timeout(wait))
+                self.dirty.clear()
+                continue
+            self.flush(now)
+            if now>=nextReport:
+                nextReport=now+self.reportInterval
+                logger.info(self.stats())
+                logger.info(writes.report())
+
+    def flush(self, now=None):
+        """Writes every queued file that's due, or all of them if now isn't given."""
+        with self.lock:
+            paths=[path for path in self.pending if now is None or self.lastWrite.get(path, 0)+self.interval<=now]
+            batch=[(path, self.pending.pop(path)) for path in paths]
+        for path, data in batch:
+            self.lastWrite[path]=clock.monotonic()
+            try:
+                self.writeFile(path, data() if callable(data) else data)
+            except Exception as e:
+                logger.error('Error %s', 'writing ' + path, exc_info=e)
+
+    def writeFile(self, path, data):
+        digest=hashlib.sha1(data).digest()
+        with self.lock:
+            self.memory[path]=data
+        if self.digests.get(path)==digest or self.mode=='ram':
+            self.skipped+=1
+            return
+        target=self.locate(path)
+        os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+        tmpPath=target + ".tmp"
+        with open(tmpPath, 'wb') as cacheFile:
+            cacheFile.write(data)
+        os.replace(tmpPath, target)
+        self.digests[path]=digest
+        self.writes+=1
+        writes.add(self.kinds.get(path, 'cache'), len(data))
+
+    def stats(self):
+        return "CACHE WRITER - MODE: " + self.mode + " WRITES: " + str(self.writes) + " SKIPPED: " + str(self.skipped) + " PENDING: " + str(len(self.pending))
+
+class gameStore:
+    """Persists the scoreboard JSON for the next cold start, off the hot path.
+
+    Only a compact projection of the fields parseGameData reads is kept. It's handed to the cacheWriter, which
+    serializes and writes only the newest copy once its interval is up.
+    """
+    def __init__(self, path, writer=None):
+        self.path=path
+        self.writer=writer or cacheFiles
+
+    def load(self):
+        """Reads the stored copy. Returns None if there isn't a usable one."""
+        try:
+            eventsJson = json.loads(self.writer.read(self.path) or b'null')
+        except ValueError:
+            return None
+        return eventsJson if isinstance(eventsJson, dict) and 'events' in eventsJson else None
+
+    def save(self, eventsJson):
+        """Queues the scoreboard JSON to be written."""
+        projected=projectGameData(eventsJson)
+        self.writer.write(self.path, lambda: json.dumps(projected, ensure_ascii=False, separators=(',',':')).encode('utf-8'))
+
+class feedRecorder:
+    """Appends every scoreboard payload pulled from the API to a gzip log, with when it was pulled, for replay.py.
+
+    Each line is a JSON object with the pull time and the payload. Lines are flushed as they're written, so a log cut
+    short by a crash or power loss still reads back up to the last pull. The path is formatted with strftime when
+    the log is opened, so a path with the date in it gets a new log each day.
+    """
+    def __init__(self, path):
+        self.path=path
+        self.openPath=None
+        self.file=None
+        self.pulls=0
+
+    def record(self, eventsJson, pulled, league="NHL"):
+        """Appends a league's payload pulled at pulled, in seconds since the epoch."""
+        path=datetime.fromtimestamp(pulled).strftime(self.path)
+        try:
+            if path!=self.openPath:
+                if self.file:
+                    self.file.close()
+                # Appending starts a new gzip member, which reads back as one stream.
+                self.file=gzip.open(path, 'ab')
+                self.openPath=path
+            line=json.dumps({'pulled': pulled, 'league': league, 'payload': eventsJson}, separators=(',',':')).encode('utf-8') + b"\n"
+            self.file.write(line)
+            self.file.flush()
+            writes.add('feed', len(line)) # Before compression, the log only knows what it was given.
+            self.pulls+=1
+        except OSError as e:
+            logger.error('Error %s', 'recording the feed', exc_info=e)
+
+def readFeed(path, league="NHL"):
+    """Reads one league from a feed log written by feedRecorder. Returns a list of (pulled, payload) tuples in the order
+    they were pulled. Logs from before there were other leagues are all NHL."""
+    records=[]
+    with gzip.open(path, 'rb') as feedFile:
+        try:
+            for line in feedFile:
+                record=json.loads(line)
+                if record.get('league', "NHL")==league:
+                    records.append((record['pulled'], record['payload']))
+        except (EOFError, ValueError):
+            # The end of a log that was still being written. Everything before it is good.
+            pass
+    return records
+
+def projectGameData(eventsJson):
+    """Returns a copy of the scoreboard JSON with only the fields parseGameData reads."""
+    events = []
+    for event in eventsJson['events']:
+        competition = event['competitions'][0]
+        projected = {
+            'id': event['id'],
+            'date': event['date'],
+            'status': {
+                'period': event['status']['period'],
+                'type': {key: event['status']['type'][key] for key in ('name','description','shortDetail')}
+            },
+            'competitions': [{
+                'date': competition['date'],
+                'competitors': [{'score': competitor['score'], 'team': {'displayName': competitor['team']['displayName'], 'abbreviation': competitor['team']['abbreviation']}} for competitor in competition['competitors'][:2]]
+            }]
+        }
+        if competition.get('headlines'):
+            projected['competitions'][0]['headlines'] = [{'shortLinkText': competition['headlines'][0]['shortLinkText']}]
+        events.append(projected)
+    return {'events': events}
+
+def getGameData(provider):
+    """Get game data for all of todays games in a league from the ESPN API, returns games as a list of Game records.
+
+    The parsed games are kept in memory in the provider's cacheData and reused when the API says nothing changed. The
+    copy on disk is only read at cold start. When to call this is up to the league's pollScheduler.
     Args:
-        teams (list of dictionaries): Team names and abberivations. Needed as the game API doen't return team abbreviations.
+        provider (leagueProvider): The league to get games for.
     Returns:
-        games (list of dictionaries): All game info needed to display on scoreboard. Teams, scores, start times, game clock, etc.
+        games (list of Games): All game info needed to display on scoreboard. Teams, scores, start times, game clock, etc.
     """
-    # Call the NHL API for today's game info. Save the rsult as a JSON object.
-    gamesend=cacheData.endTime()
-    logger.info("GAME JSON - DELAY: " + str(cacheData.gameCacheDelay) + " LASTCACHE: " + cacheData.lastCacheTime.strftime("%H:%M:%S") + " START: " + datetime.now().strftime("%H:%M:%S") + " END: " + gamesend.strftime("%H:%M:%S"))
-    openType='r+'
-    if gamesend<=datetime.now():
-        logger.info("FLUSH AND PULL API")
-        cacheData.lastCacheTime=datetime.now()
-        cacheData.gameCacheDelay=0
-        openType='w+' #flush and pull api
-    with open(sbPath + "cache/games.json", openType, encoding='utf-8') as gamesJsonFile:
-        if gamesJsonFile.read(1):            
-            gamesJsonFile.seek(0)
-            eventsJson = json.load(gamesJsonFile)
-            logger.info("READ FROM CACHE")
-        else:            
-            eventsResponse = requests.get(url="https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard")
-            eventsJson = eventsResponse.json()
-            json.dump(eventsJson, gamesJsonFile, ensure_ascii=False, indent=4)
-            logger.info("READ FROM GAMES JSON API")
-    gamesJsonFile.close()    
-    # Decalare an empty list to hold the games dicts.
-    games = []
-
-    # For each game, build a dict recording it's information. Append this to the end of the teams list.
-    if eventsJson['events']: # If games today.
-        allGamesEnded = True
-        earliestGame = utcToLocal(datetime(2037,1,1,0,0,0,0,timezone.utc))
-        earliestDay = 32
-        for event in eventsJson['events']:
-            # Prep the period data for consistancy. This data doesn't exist in the API responce until game begins.
-            if event['status']['period']>0:
-                perInfo = event['status']['type']['shortDetail'].split(' - ')
-                if len(perInfo)>1:
-                    perName = perInfo[1]
-                    perTimeRem = perInfo[0]
-                else:
-                    perName = perInfo[0]
-                    perTimeRem = "0:00"
-            else:
-                perName = "Not Started"
-                perTimeRem = "Not Started"
-
-            # Prep the dict data.
-            gameDict = {
-                'Game ID': event['id'],
-                #trash hack using 0/1 for now
-                'Date': utcToLocal(datetime.strptime(event['date'], '%Y-%m-%dT%H:%MZ')),
-                'Home Team': event['competitions'][0]['competitors'][0]['team']['displayName'],                
-                'Home Abbreviation': event['competitions'][0]['competitors'][0]['team']['abbreviation'],
-                'Away Team': event['competitions'][0]['competitors'][1]['team']['displayName'],                 
-                'Away Abbreviation': event['competitions'][0]['competitors'][1]['team']['abbreviation'],
-                'Home Score': event['competitions'][0]['competitors'][0]['score'],
-                'Away Score': event['competitions'][0]['competitors'][1]['score'],                
-                'Start Time UTC':  datetime.strptime(event['competitions'][0]['date'], '%Y-%m-%dT%H:%MZ'), # Extracts the startime from what's given by the API.
-                'Start Time Local': utcToLocal(datetime.strptime(event['competitions'][0]['date'], '%Y-%m-%dT%H:%MZ')), # Converts the UTC start time to the RPi's local timezone.
-                'Status': event['status']['type']['name'],
-                'Detailed Status': event['status']['type']['description'],
-                'Period Number': event['status']['period'],
-                'Recap': '',
-                'Period Name': perName,
-                'Period Time Remaining': perTimeRem
-            }
-
-            if event['competitions'][0].get('headlines'):
-                gameDict['Recap']=event['competitions'][0]['headlines'][0]['shortLinkText']
-
-            # Check to see if we reset the cache
-            if gameDict['Status']=="STATUS_SCHEDULED":
-                allGamesEnded = False
-                earliestGame = gameDict['Start Time Local'] if gameDict['Start Time Local'] < earliestGame else earliestGame
-                earliestDay = gameDict['Date'].day if gameDict['Date'].day < earliestDay else earliestDay
-            elif gameDict['Status']!="STATUS_FINAL":
-                allGamesEnded = False
-                earliestDay = datetime.now().day
-                earliestGame = utcToLocal(datetime.now(timezone.utc))
-                cacheData.gameCacheDelay=5
-
-            # Append the dict to the games list.
-            games.append(gameDict)
-
-            # Sort list by Game ID. Ensures order doesn't change as games end.
-            games.sort(key=lambda x:x['Game ID'])
-        
-        now = datetime.now()        
-        if earliestDay!=now.day:
-            endOfDay = datetime(now.year,now.month,now.day,23,59,59,0,utcToLocal(now).tzinfo)
-            cacheData.gameCacheDelay=timeUntil(endOfDay,True).seconds
-        elif earliestGame!=datetime(2037,1,1,0,0,0,0,timezone.utc) and cacheData.gameCacheDelay<=0:
-            cacheData.gameCacheDelay=timeUntil(earliestGame,True).seconds
-        elif allGamesEnded and cacheData.gameCacheDelay<=0:
-            cacheData.gameCacheDelay=timeUntil(now + timedelta(hours = 1)).seconds
-        elif cacheData.gameCacheDelay<=5:
-            cacheData.gameCacheDelay=5
-    
+    cacheData = provider.cacheData
+    if cacheData.games is None:
+        # Cold start. Seed from the last copy on disk so there's something to fall back on if the pull fails.
+        eventsJson = provider.store.load()
+        if eventsJson is not None:
+            cacheData.games = parseGameData(eventsJson, provider.key, provider.parser)
+            logger.info("READ FROM CACHE " + provider.key)
+
+    # Call the API for today's game info. Save the rsult as a JSON object.
+    logger.info("PULL API " + provider.key + " - LASTCACHE: " + (cacheData.lastCacheTime.strftime("%H:%M:%S") if cacheData.lastCacheTime else "NEVER"))
+    cacheData.lastCacheTime=clock.now()
+    # Only revalidate when there's a parsed copy to fall back on.
+    start = time.monotonic()
+    eventsJson = espn.getJson(provider.scoreboardUrl, cacheData.games is not None)
+    provider.fetchTime = time.monotonic()-start
+    if eventsJson is None:
+        # Nothing changed since the last pull, skip parsing and reuse those games.
+        logger.info("GAMES JSON NOT MODIFIED " + provider.key)
+    else:
+        logger.info("READ FROM GAMES JSON API " + provider.key)
+        if recorder:
+            recorder.record(eventsJson, clock.time(), provider.key)
+        start = time.monotonic()
+        cacheData.games = tracker.update(eventsJson['events'], provider.key, provider.parser)
+        provider.parseTime = time.monotonic()-start
+        metrics.observe('scoreboard_parse_seconds', provider.parseTime, league=provider.key)
+        provider.store.save(eventsJson)
+
+    return cacheData.games
+
+def parseGameData(eventsJson, league="NHL", parser=None):
+    """Builds the list of Game records from a league's scoreboard JSON."""
+    parser = parser or parseEvent
+    games = [parser(event, league) for event in eventsJson['events']]
+
+    # Sort list by Game ID. Ensures order doesn't change as games end.
+    games.sort(key=lambda game:game.gameId)
     return games
 
+def parseEvent(event, league="NHL"):
+    """Builds a Game record from one event in a league's scoreboard JSON. ESPN uses the same layout for every sport."""
+    # Prep the period data for consistancy. This data doesn't exist in the API responce until game begins.
+    if event['status']['period']>0:
+        perInfo = event['status']['type']['shortDetail'].split(' - ')
+        if len(perInfo)>1:
+            perName = perInfo[1]
+            perTimeRem = perInfo[0]
+        else:
+            perName = perInfo[0]
+            perTimeRem = "0:00"
+    else:
+        perName = "Not Started"
+        perTimeRem = "Not Started"
+
+    competition = event['competitions'][0]
+    home = competition['competitors'][0]
+    away = competition['competitors'][1]
+
+    # Parse each timestamp once. The event date and the start time are usually the same string.
+    startTimeUtc = datetime.strptime(competition['date'], '%Y-%m-%dT%H:%MZ') # Extracts the startime from what's given by the API.
+    startTimeLocal = utcToLocal(startTimeUtc) # Converts the UTC start time to the RPi's local timezone.
+    date = startTimeLocal if event['date']==competition['date'] else utcToLocal(datetime.strptime(event['date'], '%Y-%m-%dT%H:%MZ'))
+
+    return Game(
+        gameId = event['id'],
+        date = date,
+        homeTeam = home['team']['displayName'],
+        homeAbbreviation = home['team']['abbreviation'],
+        awayTeam = away['team']['displayName'],
+        awayAbbreviation = away['team']['abbreviation'],
+        homeScore = int(home['score'] or 0),
+        awayScore = int(away['score'] or 0),
+        startTimeUtc = startTimeUtc,
+        startTimeLocal = startTimeLocal,
+        status = GameStatus(event['status']['type']['name']),
+        detailedStatus = event['status']['type']['description'],
+        periodNumber = event['status']['period'],
+        periodName = perName,
+        periodTimeRemaining = perTimeRem,
+        recap = competition['headlines'][0]['shortLinkText'] if competition.get('headlines') else '',
+        league = league
+    )
+
 def getMaxBrightness(time):
     """ Calculates the maximum brightness and fade step incremements based on the time of day.
 
@@ -238,12 +1925,23 @@ def cropImage(image):
 
     return croppedImage
 
+def logoPath(team, league="NHL"):
+    """Returns the path of the PNG logo for a team abbreviation in a league, or the league logo for "NHL"."""
+    if team=="NHL":
+        return sbPath + "assets/images/NHL_Logo_Simplified.png"
+    provider = providers.get(league)
+    registered = provider.registry.get(team) if provider and provider.registry else None
+    if registered:
+        return sbPath + registered.logo
+    # Teams newer than the teams JSON can still have a logo.
+    return sbPath + (provider.logoDir if provider else "assets/images/team logos/png/") + team + ".png"
+
 def utcToLocal(utc_dt):
     """Returns a time object converted to the local timezone set on the RPi."""
     return utc_dt.replace(tzinfo=timezone.utc).astimezone(tz=None)
 
 def isCurrentTimeBetween(startTime, endTime):
-    now = datetime.now()
+    now = clock.now()
     sTime=startTime
     eTime=endTime
     if sTime.year==1900:
@@ -259,8 +1957,8 @@ def isCurrentTimeBetween(startTime, endTime):
         return now >= sTime or now <= eTime
 
 def timeUntil(startTime,utc=False):
-    now = datetime.now()
-    if utc: now = utcToLocal(datetime.now(timezone.utc))
+    now = clock.now()
+    if utc: now = utcToLocal(clock.now(timezone.utc))
     sTime=startTime
     if sTime.year==1900:
         sTime=sTime.replace(month=now.month,day=now.day,year=now.year)
@@ -270,8 +1968,8 @@ def timeUntil(startTime,utc=False):
     return sTime - now
 
 def sameDay(startTime,utc=False):
-    now = datetime.now()
-    if utc: now = utcToLocal(datetime.now(timezone.utc))
+    now = clock.now()
+    if utc: now = utcToLocal(clock.now(timezone.utc))
     sTime=startTime
     if sTime.year==1900:
         return True
@@ -281,89 +1979,102 @@ def checkGoalScorer(game, gameOld):
     """Checks if a team has scored.
 
     Args:
-        game (dict): All information for a specific game.
-        gameOld (dict): Same information from one update cycle ago.
+        game (Game): All information for a specific game.
+        gameOld (Game): Same information from one update cycle ago.
 
     Returns:
         scoringTeam (string): If either team has scored. both/home/away/none.
     """
 
     # Check if either team has score by compare the score of the last cycle. Set scoringTeam accordingly.
-    if game['Away Score'] > gameOld['Away Score'] and game['Home Score'] == gameOld['Home Score']:
+    if game.awayScore > gameOld.awayScore and game.homeScore == gameOld.homeScore:
         scoringTeam = "away"
-    elif game['Away Score'] == gameOld['Away Score'] and game['Home Score'] > gameOld['Home Score']:
+    elif game.awayScore == gameOld.awayScore and game.homeScore > gameOld.homeScore:
         scoringTeam = "home"
-    elif game['Away Score'] > gameOld['Away Score'] and game['Home Score'] > gameOld['Home Score']:
+    elif game.awayScore > gameOld.awayScore and game.homeScore > gameOld.homeScore:
         scoringTeam = "both"
     else:
         scoringTeam = "none"
 
     return scoringTeam
 
-def buildGame(game, gameOld, scoringTeam):
+def buildGame(game, scoringTeam):
     """Args:
-        game (dict): All information for a specific game.
-        gameOld (dict): The same information, but from one cycle ago.
+        game (Game): All information for a specific game.
         scoringTeam (string): If the home team, away team, or both, or neither scored.
     """
 
+    # Reuse the card if nothing on it has changed since it was last built.
+    start = time.perf_counter()
+    key = scenes.key(game, scoringTeam, image.size)
+    scene = scenes.get(key)
+    if scene is not None:
+        frame, goalData = scene
+        image.paste(frame)
+        metrics.observe('scoreboard_card_render_seconds', time.perf_counter()-start, cached="yes")
+        return goalData
+
+    # Start from a blank image so the card only depends on the game.
+    draw.rectangle(((0,0),(endPixel,endHeight)), fill=fillBlack)
     # Add the logos of the teams inivolved to the image.
-    displayLogos(game['Away Abbreviation'],game['Home Abbreviation'])    
+    displayLogos(game.awayAbbreviation,game.homeAbbreviation,game.league)
     # Add the period to the image.
     displayPeriod(game)
     # Add the current score to the image. Note if either team scored.
-    return displayScore(game,scoringTeam)
+    goalData = displayScore(game,scoringTeam)
+
+    scenes.put(key, image.copy(), goalData)
+    metrics.observe('scoreboard_card_render_seconds', time.perf_counter()-start, cached="no")
+    return goalData
 
 def buildLoading():
     """Adds all aspects of the loading screen to the image object."""
 
     # Add the NHL logo to the image.
-    nhlLogo = Image.open(sbPath + "assets/images/NHL_Logo_Simplified.png")
-    nhlLogo = cropImage(nhlLogo)
-    nhlLogo.thumbnail((40,30))
+    nhlLogo = logos.getLogo("NHL",(40,30))
     image.paste(nhlLogo, (1, 1))
 
     # Add "Now Loading" to the image.
-    draw.text((29,7), "Loading", font=fontDefault, fill=fillWhite)
+    drawText((29,7), "Loading", font=fontDefault, fill=fillWhite)
+
+@functools.lru_cache(maxsize=128)
+def getFadeMask(width, height, reverse=False, black=255, gradient_magnitude=1.):
+    """Returns the 'L' mask used by fadeImage. Built in a single frombytes call and memoized, since logo sizes repeat."""
+    levels = [int(black * (1 - gradient_magnitude * float(x)/width)) for x in range(width)]
+    if reverse:
+        levels = [black-level for level in levels]
+    row = bytes(min(max(level,0),255) for level in levels)
+    return Image.frombytes('L', (width, 1), row).resize((width, height))
 
 def fadeImage(im, reverse=False, black=255, gradient_magnitude=1.):
-    if im.mode != 'RGBA':
+    """Fades an image horizontally to black. The image is faded in place and returned."""
+    if im.mode not in ('RGB', 'RGBA'):
         im = im.convert('RGBA')
     width, height = im.size
-    gradient = Image.new('L', (width, 1), color=0xFF)    
-    for x in range(width):
-        # gradient.putpixel((x, 0), 255-x)        
-        if reverse:
-            gradient.putpixel((x, 0), black-int(black * (1 - gradient_magnitude * float(x)/width)))
-        else:
-            gradient.putpixel((x, 0), int(black * (1 - gradient_magnitude * float(x)/width)))
-    alpha = gradient.resize(im.size)
-    black_im = Image.new('RGBA', (width, height), color=0) # i.e. black
-    black_im.putalpha(alpha)    
-    gradient_im = Image.alpha_composite(im, black_im)
-    return gradient_im
+    # Painting black through the gradient mask gives the same result as compositing a black gradient over the image.
+    im.paste(fillBlack, (0, 0), getFadeMask(width, height, reverse, black, gradient_magnitude))
+    return im
+
 
+def drawText(xy, text, font, fill, anchor=None):
+    """Draws text onto the image from the glyph atlas. Takes the same arguments as draw.text."""
+    glyphs.drawText(image, xy, text, font, fill, anchor)
 
-def displayLogos(awayTeam, homeTeam):
+def displayLogos(awayTeam, homeTeam, league="NHL"):
     """Adds the logos of the home and away teams to the image object, making sure to not overlap text and center logos.
 
     Args:
         awayTeam (string): Abbreviation of the away team.
         homeTeam (string): Abbreviation of the home team.
+        league (string, optional): League the teams are in. Defaults to "NHL".
     """
 
     # Difine the max width and height that a logo can be.
     logoSize = (40,30)
 
-    # Load, crop, and resize the away team logo.
-    awayLogo = Image.open(sbPath + "assets/images/team logos/png/" + awayTeam + ".png")
-    awayLogo = cropImage(awayLogo)
-    awayLogo.thumbnail(logoSize)
-
-    # Load, crop, and resize the home team logo.
-    homeLogo = Image.open(sbPath + "assets/images/team logos/png/" + homeTeam + ".png")
-    homeLogo = cropImage(homeLogo)
-    homeLogo.thumbnail(logoSize)
+    # Get the cropped, resized and faded logos. These are only built the first time a team is shown.
+    awayLogo = logos.getLogo(awayTeam,logoSize,True,225,league)
+    homeLogo = logos.getLogo(homeTeam,logoSize,False,225,league)
 
     # Record the width and heights of the logos.
     awayLogoWidth, awayLogoHeight = awayLogo.size
@@ -373,75 +2084,74 @@ def displayLogos(awayTeam, homeTeam):
 
     # Add the logos to the image.
     # Logos will be bounded by the text region, and be centered vertically.
-    image.paste(fadeImage(awayLogo,True,225), (middleAdj-awayLogoWidth, math.floor((options.rows-awayLogoHeight)/2)))
-    image.paste(fadeImage(homeLogo,False,225), (middleAdj+22, math.floor((options.rows-homeLogoHeight)/2)))
+    image.paste(awayLogo, (middleAdj-awayLogoWidth, math.floor((options.rows-awayLogoHeight)/2)))
+    image.paste(homeLogo, (middleAdj+22, math.floor((options.rows-homeLogoHeight)/2)))
     
     if debug:
         draw.line([(63,0),(63,options.rows)],fill=fillRed,width=2)
 
 def displayPeriod(game):
-    date = game['Date']
-    status = game['Status']
-    periodName = game['Period Name']
-    timeRemaining = game['Period Time Remaining']
+    date = game.date
+    status = game.status
+    periodName = game.periodName
+    timeRemaining = game.periodTimeRemaining
 
     gameDay = "Today" if sameDay(date,True) else str(date.month) + "/" + str(date.day)
 
-    startTime = game['Start Time Local']
+    startTime = game.startTimeLocal
     startTime = startTime.time().strftime('%I:%M %p')
     startTime = str(startTime) # Cast to a string for easier parsing.
     if startTime[0]=="0": #strip leading 0
         startTime=startTime[1:]
 
-    if status=="STATUS_SCHEDULED":
+    if status==GameStatus.SCHEDULED:
         timeRemaining=startTime
         periodName=gameDay
-    if status!="STATUS_FINAL":
-        draw.text((firstMiddleCol+12,13), timeRemaining, font=fontDefault, fill=fillWhite, anchor="ms")        
+    if status!=GameStatus.FINAL:
+        drawText((firstMiddleCol+12,13), timeRemaining, font=fontDefault, fill=fillWhite, anchor="ms")        
 
-    draw.text((firstMiddleCol+12,7), periodName, font=fontDefault, fill=fillWhite, anchor="ms")
+    drawText((firstMiddleCol+12,7), periodName, font=fontDefault, fill=fillWhite, anchor="ms")
 
 def displayScore(game,scoringTeam = "none"):
     """Add the score for both teams to the image object.
     Args:
-        awayScore (int): Score of the away team.
-        homeScore (int): Score of the home team.
+        game (Game): The game to show the score of.
         scoringTeam (str, optional): The team that scored if applicable. Options: "away", "home", "both", "none". Defaults to "none".
     """    
-    status=game['Status']
-    awayTeam=game['Away Abbreviation']
-    awayScore=game['Away Score']
-    homeScore=game['Home Score']
-    homeTeam=game['Home Abbreviation']
-    goalData = {'score':'','location':'','team':'','isHome':False,'secondScore':'','secondLocation':(0,0),'secondTeam':'','both':False}
-    if status=="STATUS_SCHEDULED":
-        draw.text((firstMiddleCol+5,17), "AT", font=fontLarge, fill=fillWhite)
+    status=game.status
+    awayTeam=game.awayAbbreviation
+    awayScore=game.awayScore
+    homeScore=game.homeScore
+    homeTeam=game.homeAbbreviation
+    goalData = {'score':'','location':'','team':'','isHome':False,'secondScore':'','secondLocation':(0,0),'secondTeam':'','both':False,'league':game.league}
+    if status==GameStatus.SCHEDULED:
+        drawText((firstMiddleCol+5,17), "AT", font=fontLarge, fill=fillWhite)
         return goalData
     
     # Add the hypen to the image.
-    draw.text((firstMiddleCol+9,17), "-", font=fontLarge, fill=fillWhite)
+    drawText((firstMiddleCol+9,17), "-", font=fontLarge, fill=fillWhite)
     # If no team scored, add both scores to the image.
     if scoringTeam == "none":
-        draw.text((firstMiddleCol+2,18), str(awayScore), font=fontLarge, fill=fillWhite)
-        draw.text((firstMiddleCol+15,18), str(homeScore), font=fontLarge, fill=(fillWhite))
+        drawText((firstMiddleCol+2,18), str(awayScore), font=fontLarge, fill=fillWhite)
+        drawText((firstMiddleCol+15,18), str(homeScore), font=fontLarge, fill=(fillWhite))
     # If either or both of the teams scored, add that number to the image in red.
     elif scoringTeam == "away":
-        draw.text((firstMiddleCol-1,18), str(awayScore), font=fontLarge, fill=fillRed)
-        draw.text((firstMiddleCol+17,18), str(homeScore), font=fontLarge, fill=fillWhite)
+        drawText((firstMiddleCol-1,18), str(awayScore), font=fontLarge, fill=fillRed)
+        drawText((firstMiddleCol+17,18), str(homeScore), font=fontLarge, fill=fillWhite)
         goalData['score']=str(awayScore)
         goalData['location']=(firstMiddleCol-1,18)
         goalData['team']=awayTeam
     elif scoringTeam == "home":
-        draw.text((firstMiddleCol-1,18), str(awayScore), font=fontLarge, fill=fillWhite)
-        draw.text((firstMiddleCol+17,18), str(homeScore), font=fontLarge, fill=fillRed)
+        drawText((firstMiddleCol-1,18), str(awayScore), font=fontLarge, fill=fillWhite)
+        drawText((firstMiddleCol+17,18), str(homeScore), font=fontLarge, fill=fillRed)
         goalData['score']=str(homeScore)
         goalData['location']=(firstMiddleCol+17,18)
         goalData['team']=homeTeam
         goalData['isHome']=True
     elif scoringTeam == "both":
-        draw.text((firstMiddleCol-1,18), str(awayScore), font=fontLarge, fill=fillRed)
-        draw.text((firstMiddleCol+17,18), str(homeScore), font=fontLarge, fill=fillRed)
-        goalData = {'score':str(awayScore), 'location':(firstMiddleCol-1,18), 'team':awayTeam, 'secondScore':str(homeScore), 'secondLocation':(firstMiddleCol+17,18), 'secondTeam':homeTeam, 'both':True}
+        drawText((firstMiddleCol-1,18), str(awayScore), font=fontLarge, fill=fillRed)
+        drawText((firstMiddleCol+17,18), str(homeScore), font=fontLarge, fill=fillRed)
+        goalData = {'score':str(awayScore), 'location':(firstMiddleCol-1,18), 'team':awayTeam, 'secondScore':str(homeScore), 'secondLocation':(firstMiddleCol+17,18), 'secondTeam':homeTeam, 'both':True, 'league':game.league}
 
     return goalData
 
@@ -451,191 +2161,366 @@ def displayGoal(goalData):
     # If both teams have scored.
     if goalData['both'] == True:
         #diplay animation
-        showGoalAnimation(goalData['secondTeam'])
-        # Fade both numbers to white.
-        for n in range(50, 256):
-            draw.text(goalData['location'], goalData['score'], font=fontLarge, fill=(255, n, n, 255))
-            draw.text(goalData['secondLocation'], goalData['secondScore'], font=fontLarge, fill=(255, n, n, 255))
-            matrix.SetImage(image)
-            time.sleep(.0015)    
+        showGoalAnimation(goalData['secondTeam'],goalData['league'])
+        scores = [(goalData['location'], goalData['score']), (goalData['secondLocation'], goalData['secondScore'])]
     # If one team has scored.
     else:
-        showGoalAnimation(goalData['team'])
-        # Fade number to white.
-        for n in range(50, 256):
-            draw.text(goalData['location'], goalData['score'], font=fontLarge, fill=(255, n, n, 255))
-            matrix.SetImage(image)
-            time.sleep(.0015)
-
-def showGoalAnimation(team):
-    if nhl.isFavoriteTeam(team) and exists(sbPath + "assets/images/goal/"+ team +".gif"):
-        display_gif(sbPath + "assets/images/goal/"+ team +".gif",1,(0,0),(fullWidth,options.rows))
-    elif exists(sbPath + "assets/images/goal/DEFAULT.gif"):
-        display_gif(sbPath + "assets/images/goal/DEFAULT.gif",1,(0,0),(fullWidth,options.rows))
-
-def runClock(duration):
-    #run for duration in seconds
-    clockstart=datetime.now()
+        showGoalAnimation(goalData['team'],goalData['league'])
+        scores = [(goalData['location'], goalData['score'])]
+
+    # Fade the scoring numbers from red to white.
+    frameCount = math.ceil(goalFlashDuration*goalFlashFps)
+    def renderFrame(frame):
+        n = 50 + round(205*frame/max(frameCount-1,1))
+        for location, score in scores:
+            drawText(location, score, font=fontLarge, fill=(255, n, n, 255))
+        output.show(image)
+    timeline.playFixed("GOAL", frameCount, goalFlashFps, renderFrame)
+
+def goalGifPath(team, league="NHL"):
+    """Returns the goal animation for a team in a league. Favorite teams get their own gif when there is one."""
+    provider = providers.get(league)
+    if provider is None:
+        return None
+    registered = provider.registry.get(team) if provider.registry else None
+    if provider.isFavoriteTeam(team) and registered and registered.goalGif:
+        return sbPath + registered.goalGif
+    elif provider.isFavoriteTeam(team) and not registered and exists(sbPath + provider.goalDir + team +".gif"):
+        return sbPath + provider.goalDir + team +".gif"
+    elif exists(sbPath + provider.goalDir + "DEFAULT.gif"):
+        return sbPath + provider.goalDir + "DEFAULT.gif"
+    return None
+
+def preloadGoalGifs():
+    """Decodes the goal animations of every league with its teams loaded ahead of time, so the first goal doesn't stall."""
+    paths = set()
+    for provider in providers.values():
+        for team in provider.registry or ():
+            paths.add(goalGifPath(team.abbreviation, provider.key))
+    for path in paths:
+        if path:
+            gifs.getFrames(path,(fullWidth,options.rows))
+
+def showGoalAnimation(team, league="NHL"):
+    path = goalGifPath(team, league)
+    if path:
+        display_gif(path,1,(0,0),(fullWidth,options.rows))
+
+def runClock(duration, worker=None, moveInterval=10):
+    """Shows the time for duration seconds, moving it around the screen every moveInterval seconds.
+
+    Nothing runs between changes. It sleeps until the minute turns over, the time is due to move or duration is up,
+    whichever is first. Given the gameDataWorker, new game data also wakes it to redraw the network status.
+    """
+    clockstart=clock.now()
     clockend=clockstart + timedelta(seconds=duration)
     logger.info("CLOCK START: " + clockstart.strftime("%H:%M:%S") + " END: " + clockend.strftime("%H:%M:%S"))
-    moveTimer=0
+    nextMove=clockstart + timedelta(seconds=moveInterval)
     x=firstMiddleCol+12
     y=centerHeight
     while True:
-        moveTimer+=0.1
-        if moveTimer>=10: #screensaver
+        now=clock.now()
+        if now>=clockend:
+            return
+        if now>=nextMove: #screensaver
             x=random.randrange(9,fullWidth-8,1) #width of ~20
             y=random.randrange(4,endHeight-2,1) #height of 5
-            moveTimer=0
-        current = time.strftime("%H:%M")
+            nextMove=now + timedelta(seconds=moveInterval)
         draw.rectangle(((0,0),(endPixel,endHeight)), fill=fillBlack) #blank screen
-        draw.text((x,y), current, font=fontDefault, fill=fillWhite, anchor="mm")
-        matrix.SetImage(image)
-        time.sleep(0.1)
-        if isCurrentTimeBetween(clockstart,clockend)==False:
-            return        
+        drawText((x,y), now.strftime("%H:%M"), font=fontDefault, fill=fillWhite, anchor="mm")
+        if worker:
+            drawNetworkStatus(worker.latest())
+        output.show(image)
+
+        nextMinute=now.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        wait=max((min(nextMinute, nextMove, clockend)-clock.now()).total_seconds(), 0)
+        if worker:
+            worker.waitForUpdate(wait)
+        else:
+            clock.sleep(wait)
+
+def drawNetworkStatus(snapshot):
+    """Draws the network status in the bottom right corner when there's a problem.
+
+    The colour is the state: amber while retrying, blue while probing a downed upstream and red while it's down and the
+    last good games are being shown. The bar grows a pixel for every 5 minutes the games have gone without an update.
+    """
+    if snapshot is None or not snapshot.networkError:
+        return
+    colour = {"retrying": fillAmber, "probing": fillBlue}.get(snapshot.networkState, fillRed)
+    age = (clock.now()-snapshot.fetched).total_seconds() if snapshot.fetched else 0
+    length = min(1+int(age/300), 8)
+    draw.rectangle(((endPixel-length+1,endHeight),(endPixel,endHeight)), fill=colour)
 
 def runScoreboard():
     """Runs the scoreboard geting scores and other game data and cycles through them in an infinite loop."""
 
     # Initial calculation and setting of the max brightness.
-    maxBrightness, fadeStep = getMaxBrightness(int(datetime.now().strftime("%H")))
-    matrix.brightness = maxBrightness
+    maxBrightness, fadeStep = getMaxBrightness(int(clock.now().strftime("%H")))
+    output.brightness = maxBrightness
 
     # Build the loading screen.
     buildLoading()
-    matrix.SetImage(image) # Set the matrix to the image.
-
-    networkError = False
-
-    # Try to get team and game data. Max of 100 attempts before it gives up.
-    for i in range(100):
-        try:
-            teams = getTeamData()
-            games = getGameData(teams,cacheData)
-            gamesOld = games # Needed for checking logic on initial loop.            
-            cycleTime = round(60/len(games))
-            networkError = False
+    output.show(image) # Set the matrix to the image.
+    firstFrame = secondsSinceStart()
+    metrics.set('scoreboard_first_frame_seconds', round(firstFrame, 3))
+    logger.info("FIRST FRAME - " + format(firstFrame, '.3f') + " s AFTER START" + (" FROM ASSET PACK" if assets else ""))
+
+    games = ()
+    snapshot = None
+
+    # Goals reported by the tracker, waiting for their game's card to come up in the rotation. Each keeps the game as
+    # of its goal, the rotation's copy can be from before it.
+    pendingGoals = {}
+    goalTimes = {} # When the first goal waiting for each game came in, to time the delay to its animation.
+    def queueGoal(gameEvent):
+        goalTimes.setdefault(gameEvent.game.gameId, clock.time())
+        scoringTeam = pendingGoals.get(gameEvent.game.gameId, ("none", None))[0]
+        pendingGoals[gameEvent.game.gameId] = (gameEvent.scoringTeam if scoringTeam in ("none", gameEvent.scoringTeam) else "both", gameEvent.game)
+    tracker.subscribe(GameEventType.GOAL, queueGoal)
+
+    def logEvent(gameEvent):
+        logger.info("EVENT " + gameEvent.type.name + " - " + gameEvent.game.awayAbbreviation + " " + str(gameEvent.game.awayScore) + " @ " + gameEvent.game.homeAbbreviation + " " + str(gameEvent.game.homeScore))
+    for eventType in GameEventType:
+        tracker.subscribe(eventType, logEvent)
+        # Any change to a game makes its cached cards stale.
+        tracker.subscribe(eventType, lambda gameEvent: scenes.invalidate(gameEvent.game.gameId))
+
+    # Team and game data are fetched by a background worker for each league, this waits for the first snapshot with
+    # games in it, from whichever league has them first. Stale games are fine, they're the last good data we have.
+    worker = gameFeed(providers.values())
+    worker.start()
+    while True:
+        # The workers back off on their own, this only wakes when one of them publishes or is due to poll.
+        snapshot = worker.waitForUpdate(worker.secondsUntilWake()+1)
+        if snapshot is not None and (snapshot.games or not snapshot.networkError):
+            games = snapshot.games
             break
 
-        # In the event that the NHL API cannot be reached, set the bottom right LED to red.
-        # TODO: Make this more robust for specific fail cases.
-        except Exception as e:
-            logger.error('Error %s', '', exc_info=e)
-            networkError = True
-            if i >= 10:
-                draw.rectangle(((endPixel,endHeight),(endPixel,endHeight)), fill=fillRed)
-                matrix.SetImage(image)
-            time.sleep(1)
+        # In the event that the API cannot be reached, show the network status in the bottom right.
+        if snapshot is not None and snapshot.networkError:
+            drawNetworkStatus(snapshot)
+            output.show(image)
+
+    preloadGoalGifs()
+    logger.info("READY - " + format(secondsSinceStart(), '.3f') + " s AFTER START")
+    if assets:
+        logger.info(assets.stats())
 
     # Wait one extra second on the loading screen. Users thought it was too quick.
-    time.sleep(1)
+    clock.sleep(1)
 
     # Fade out.
-    for brightness in range(maxBrightness,0,-fadeStep):
-        matrix.brightness = brightness
-        matrix.SetImage(image)
-        time.sleep(.025)
+    fadeBrightness(range(maxBrightness,0,-fadeStep))
 
     # "Wipe" the image by writing over the entirity with a black rectangle.
     draw.rectangle(((0,0),(endPixel,endHeight)), fill=fillBlack)
-    matrix.SetImage(image)
+    output.show(image)
+
+    sleeping = False
 
     while True:        
         # Update the maxBrightness and fadeSteps.
-        maxBrightness, fadeStep = getMaxBrightness(int(datetime.now().strftime("%H")))
+        maxBrightness, fadeStep = getMaxBrightness(int(clock.now().strftime("%H")))
 
-        # Adjusting cycle time to only hit API once a min
-        cycleTime = round(60/len(games))
         if isCurrentTimeBetween(timeStart,timeEnd):
+            if sleeping:
+                # Just woke up. Ask for fresh data and give it a moment to arrive before the first rotation.
+                sleeping = False
+                worker.refresh()
+                snapshot = worker.waitForUpdate(10)
+                games = snapshot.games
+
             # If there's games today.
             if games:
-                # Loop through both the games and gamesOld arrays.
-                for game, gameOld in zip(games, gamesOld):
+                # Adjusting cycle time to only hit API once a min
+                cycleTime = round(60/len(games))
+                for game in games:
 
-                    # Check if either team has scored.
-                    scoringTeam = checkGoalScorer(game, gameOld)
+                    # Check if either team has scored since the game was last shown. If so, show the game as it is
+                    # now rather than as it was when the rotation started.
+                    scoringTeam, goalGame = pendingGoals.pop(game.gameId, ("none", None))
+                    if goalGame is not None:
+                        game = tracker.current(goalGame)
+                    goalTime = goalTimes.pop(game.gameId, None)
 
                     # If the game is postponed, build the postponed screen.
-                    #if game['Detailed Status'] == "Postponed":
+                    #if game.status == GameStatus.POSTPONED:
                     #    buildGamePostponed(game)
 
-                    goalData = buildGame(game, gameOld, scoringTeam)                    
+                    goalData = buildGame(game, scoringTeam)                    
 
-                    # Set bottom right LED to red if there's a network error.
-                    if networkError:
-                        draw.rectangle(((endPixel,endHeight),(endPixel,endHeight)), fill=fillRed)
+                    # Show the network status in the bottom right if there's a network error.
+                    drawNetworkStatus(snapshot)
 
                     # Fade up to the image.
-                    for brightness in range(0,maxBrightness,fadeStep):
-                        matrix.brightness = brightness
-                        matrix.SetImage(image)
-                        time.sleep(.025)
+                    fadeBrightness(range(0,maxBrightness,fadeStep))
 
                     # Hold the screen before fading.
                     if confCycleTime>cycleTime:
                         cycleTime=confCycleTime
 
+                    if goalTime is not None and goalData['score']!='':
+                        metrics.observe('scoreboard_goal_delay_seconds', clock.time()-goalTime)
                     displayGoal(goalData)
 
-                    time.sleep(cycleTime)
+                    clock.sleep(cycleTime)
 
                     # Fade down to black.
-                    for brightness in range(maxBrightness,0,-fadeStep):
-                        matrix.brightness = brightness
-                        matrix.SetImage(image)
-                        time.sleep(.025)
+                    fadeBrightness(range(maxBrightness,0,-fadeStep))
 
                     # Make the screen totally blank between fades.
                     draw.rectangle(((0,0),(endPixel,endHeight)), fill=fillBlack) 
-                    matrix.SetImage(image)
+                    output.show(image)
+
+                logger.info(scenes.stats())
+                logger.info(logos.stats())
+                logger.info(gifs.stats())
+                logger.info(timeline.stats())
+                logger.info(output.stats())
+                for provider in providers.values():
+                    logger.info(provider.stats())
             
-            # Refresh the game data.
-            # Record the data of the last cycle in gamesOld to check for goals.
-            try:
-                gamesOld = games
+            else:
+                # Nothing to show. Sleep until the next poll is due, or the worker publishes something new.
+                worker.waitForUpdate(worker.secondsUntilWake()+1)
 
-                games = getGameData(teams,cacheData)
-                networkError = False
-            except:
+            # Pick up the latest game data. The worker keeps it fresh in the background.
+            snapshot = worker.latest()
+            games = snapshot.games
+            if snapshot.networkError:
                 logger.info("Network Error")
-                networkError = True
         else:
+            sleeping = True
             # "Wipe" the image by writing over the entirity with a black rectangle.
             draw.rectangle(((0,0),(endPixel,endHeight)), fill=fillBlack)
-            matrix.brightness=maxBrightness
-            matrix.SetImage(image)
+            output.brightness=maxBrightness
+            output.show(image)
             waitTime = timeUntil(timeStart)
             dispTime = str(waitTime + timedelta(days=-1*waitTime.days)).split(':')
-            cacheData.gameCacheDelay=0 #Reset cache time so when we wake we can look it up.
             if waitTime.seconds>300:
                 logger.info("Sleeping due to screen off times. Will wake and try API again in " + dispTime[0] + " hours and " + dispTime[1] + " mins.")
                 draw.rectangle(((0,0),(endPixel,endHeight)), fill=fillBlack) #blank screen        
-                draw.text((firstMiddleCol+12,centerHeight-5), "Sleep - Wake in", font=fontDefault, fill=fillWhite, anchor="mm")
-                draw.text((firstMiddleCol+12,centerHeight+5), dispTime[0] + " hrs & " + dispTime[1] + " mins", font=fontDefault, fill=fillWhite, anchor="mm")
-                matrix.SetImage(image)
-                time.sleep(5)
+                drawText((firstMiddleCol+12,centerHeight-5), "Sleep - Wake in", font=fontDefault, fill=fillWhite, anchor="mm")
+                drawText((firstMiddleCol+12,centerHeight+5), dispTime[0] + " hrs & " + dispTime[1] + " mins", font=fontDefault, fill=fillWhite, anchor="mm")
+                output.show(image)
+                clock.sleep(5)
             if waitTime.seconds>60:
                 logger.info("Waking up in " + str(waitTime.seconds) + " seconds.")
                 draw.rectangle(((0,0),(endPixel,endHeight)), fill=fillBlack) #blank screen
-                draw.text((firstMiddleCol+12,centerHeight), "Start in " + str(waitTime.seconds), font=fontDefault, fill=fillWhite, anchor="mm")
-                matrix.SetImage(image)                
+                drawText((firstMiddleCol+12,centerHeight), "Start in " + str(waitTime.seconds), font=fontDefault, fill=fillWhite, anchor="mm")
+                output.show(image)                
                 if showClockWhileSleeping:
-                    runClock(waitTime.seconds-60)
+                    runClock(waitTime.seconds-60, worker)
                 else:
-                    time.sleep(waitTime.seconds-60) #sleep until one min prior to start time and check again
+                    clock.sleep(waitTime.seconds-60) #sleep until one min prior to start time and check again
             if waitTime.seconds<60 and waitTime.seconds>1:
                 logger.info("Waking up in " + str(waitTime.seconds) + " seconds.")
                 display_gif(sbPath + "assets/images/idle.gif",1,(firstMiddleCol,0),(25,32),200)
 
-if __name__ == "__main__":
-    # Read in configs from INI
-    config = configparser.ConfigParser()
-    #config.read('setup/scoreboard.conf')
-    config.read('rgb_scoreboard.conf')
-    
-    # Configure options for the matrix
-    options = RGBMatrixOptions()
+class repeatFilter(logging.Filter):
+    """Rate limits warnings and errors. A message that repeats within interval seconds of when it was last logged is
+    dropped, and the next copy to get through says how many were."""
+    def __init__(self, interval=300):
+        super().__init__()
+        self.interval=interval
+        self.seen={} # Message to (when it was last logged, copies dropped since).
+        self.lock=threading.Lock()
+
+    def filter(self, record):
+        if record.levelno<logging.WARNING:
+            return True
+        key=(record.name, record.levelno, record.getMessage(), record.exc_info[0] if record.exc_info else None)
+        now=time.monotonic()
+        with self.lock:
+            logged, dropped = self.seen.get(key, (None, 0))
+            if logged is not None and now-logged<self.interval:
+                self.seen[key]=(logged, dropped+1)
+                return False
+            self.seen[key]=(now, 0)
+            if len(self.seen)>256:
+                self.seen={key: value for key, value in self.seen.items() if now-value[0]<self.interval}
+        if dropped:
+            record.msg=record.getMessage() + " (REPEATED " + str(dropped) + " TIMES IN " + str(round(now-logged)) + "s)"
+            record.args=None
+        return True
+
+class meteredFileHandler(logging.handlers.RotatingFileHandler):
+    """A RotatingFileHandler that counts the bytes it writes in the writeMeter."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.position=self.stream.tell() if self.stream else 0
+
+    def emit(self, record):
+        super().emit(record)
+        if self.stream:
+            position=self.stream.tell()
+            # A rollover starts the file again from nothing.
+            writes.add('log', position-self.position if position>=self.position else position)
+            self.position=position
+
+def setupLogging(config):
+    """Logs through a queue, so the display loop never waits on the SD card or the console.
+
+    Records are formatted where they're logged and written by a listener thread, to a log file rotated by size and
+    to the console. Each start rolls the last run's log over to a backup. Repeated warnings and errors are rate
+    limited before they're queued. Returns the listener, stopping it writes out anything still queued.
+    """
+    path = config.get('scoreboard', 'log')
+    fileHandler = meteredFileHandler(path, maxBytes=config.getint('scoreboard', 'logMaxKB', fallback=1024)*1024,
+                                     backupCount=config.getint('scoreboard', 'logBackups', fallback=2), encoding='utf-8')
+    if fileHandler.stream and fileHandler.position:
+        fileHandler.doRollover()
+        fileHandler.position = 0
+    fileHandler.setFormatter(logging.Formatter('%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s', '%H:%M:%S'))
+
+    # Only the scoreboard's own records go to the console.
+    consoleHandler = logging.StreamHandler()
+    consoleHandler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    consoleHandler.addFilter(logging.Filter('scoreboard'))
+
+    logQueue = queue.SimpleQueue()
+    queueHandler = logging.handlers.QueueHandler(logQueue)
+    queueHandler.addFilter(repeatFilter(config.getint('scoreboard', 'logRepeatInterval', fallback=300)))
+    root = logging.getLogger()
+    root.addHandler(queueHandler)
+    root.setLevel(logging.INFO)
+
+    listener = logging.handlers.QueueListener(logQueue, fileHandler, consoleHandler)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+def collectMetrics():
+    """Copies the cache counts, bytes written and the age of each league's games into the metrics."""
+    for name, cache in (("logo", logos), ("gif", gifs), ("scene", scenes)):
+        metrics.set('scoreboard_cache_requests_total', cache.hits, cache=name, result="hit")
+        metrics.set('scoreboard_cache_requests_total', cache.misses, cache=name, result="miss")
+    for kind, size in dict(writes.totals).items():
+        metrics.set('scoreboard_bytes_written_total', size, kind=kind)
+    for provider in providers.values():
+        if provider.lastGood:
+            metrics.set('scoreboard_games_age_seconds', (clock.now()-provider.lastGood).total_seconds(), league=provider.key)
+
+metrics.collect(collectMetrics)
+
+def setupScoreboard(config):
+    """Sets up the matrix, image, fonts, caches and data services from the config."""
+    global options, matrix, image, draw, sbPath, fontMedium, fontLarge, fontDefault, logos, glyphs, scenes, gifs
+    global fillWhite, fillBlack, fillRed, fillAmber, fillBlue, fullWidth, centerWidth, centerHeight, firstMiddleCol, endPixel, endHeight
+    global output, timeline, fadeFps, goalFlashFps, goalFlashDuration, confCycleTime, timeStart, timeEnd, disableFade, debug, showClockWhileSleeping
+    global espn, recorder, providers, tracker, assets, exporter, cacheFiles
+
+    # Configure options for the matrix. Auto uses the hardware when its bindings are installed, the virtual matrix
+    # otherwise. Asking for the hardware without them is an error, a dark panel shouldn't pass for a running one.
+    backend = config.get('matrix', 'backend', fallback='hardware')
+    if backend=='auto':
+        backend = 'hardware' if RGBMatrix else 'virtual'
+        logger.info("MATRIX BACKEND - AUTO: " + backend)
+    if backend=='hardware' and RGBMatrix is None:
+        logger.error('Error %s', 'importing rgbmatrix for the hardware backend, set backend = virtual or auto to run without the panel', exc_info=rgbmatrixError)
+        raise rgbmatrixError
+    options = RGBMatrixOptions() if backend=='hardware' else virtualMatrixOptions()
     options.rows = config.getint('matrix', 'rows')
     options.cols = config.getint('matrix', 'cols')
     options.chain_length = config.getint('matrix', 'chain_length')
@@ -645,7 +2530,11 @@ if __name__ == "__main__":
     options.drop_privileges = False
 
     # Define a matrix object from the options.
-    matrix = RGBMatrix(options = options)
+    if backend=='hardware':
+        matrix = RGBMatrix(options = options)
+    else:
+        matrix = virtualMatrix(options, config.getint('virtual', 'refreshHz', fallback=120), config.getint('virtual', 'ringSize', fallback=600),
+                               config.get('virtual', 'pngPath', fallback=''), config.get('virtual', 'rawPath', fallback=''))
 
     # Define an image object that will be printed to the matrix.
     image = Image.new("RGB", (options.cols*options.chain_length, options.rows))
@@ -659,10 +2548,34 @@ if __name__ == "__main__":
     fontLarge = ImageFont.truetype(sbPath + "assets/fonts/score_large.otf",16)
     fontDefault = fontMedium
 
+    # Logos, goal gifs and glyphs come ready made from the asset pack when there's one built for this panel.
+    packPath = config.get('scoreboard', 'assetPack', fallback='')
+    assets = assetPack.open(packPath, (options.cols*options.chain_length, options.rows)) if packPath else None
+    if packPath and not assets:
+        logger.info("NO CURRENT ASSET PACK AT " + packPath + ", RUN packAssets.py TO BUILD ONE")
+
+    # Cache files are written in the background and coalesced, or kept off the SD card altogether in tmpfs or ram mode.
+    cacheMode = config.get('cache', 'mode', fallback='disk')
+    cacheFiles = cacheWriter(cacheMode, config.get('cache', 'tmpfsPath', fallback='/dev/shm/scoreboard'), config.getint('cache', 'flushInterval', fallback=60))
+    cacheFiles.start()
+    # Anything still held back goes out at shutdown, before the log listener stops.
+    atexit.register(cacheFiles.flush)
+    gifStore = config.get('scoreboard', 'gifFrameStore', fallback='')
+    if gifStore and cacheMode!='disk':
+        # Decoded gifs stay in memory anyway, the store only saves decoding them again after a restart.
+        gifStore = cacheFiles.locate(gifStore) if cacheMode=='tmpfs' else ''
+
+    logos = logoCache(config.getint('scoreboard', 'logoCacheSize', fallback=72), assets)
+    glyphs = glyphAtlas(pack=assets)
+    scenes = sceneCache()
+    gifs = gifCache(config.getint('scoreboard', 'gifCacheMB', fallback=16)*1024*1024, gifStore, assets)
+
     # Declare text colours that are needed.
     fillWhite = 255,255,255,255
     fillBlack = 0,0,0,255
     fillRed = 255,50,50,255
+    fillAmber = 255,150,0,255
+    fillBlue = 50,100,255,255
 
     fullWidth = options.cols*options.chain_length
     centerWidth = fullWidth/2
@@ -671,6 +2584,14 @@ if __name__ == "__main__":
     endPixel = fullWidth-1
     endHeight = options.rows-1
 
+    output = frameOutput(matrix, fullWidth, options.rows)
+
+    # Animations are scheduled against deadlines at these rates.
+    timeline = animationTimeline()
+    fadeFps = 40
+    goalFlashFps = 60
+    goalFlashDuration = 0.3
+
     confCycleTime = config.getint('scoreboard', 'confCycleTime')
     timeStart=datetime.strptime(config.get('scoreboard', 'timeStart'), "%H:%M%p")
     timeEnd=datetime.strptime(config.get('scoreboard', 'timeEnd'), "%H:%M%p")    
@@ -678,30 +2599,41 @@ if __name__ == "__main__":
     debug=config.getboolean('scoreboard', 'debug')
     showClockWhileSleeping=config.getboolean('scoreboard', 'showClockWhileSleeping')
 
-    cacheData = cacheInfo()
-    cacheData.lastCacheTime=datetime.now()
-    cacheData.gameCacheDelay=0
-
-    # NHL CONFIG
-    nhl = nhlInfo()
-    nhl.enabled = config.getboolean('NHL', 'enabled')
-    nhl.favoriteTeams = config.get('NHL', 'favoriteTeams')
-    # END NHL CONFIG
-
-    logging.basicConfig(filename=config.get('scoreboard','log'),
-                    filemode='w+',
-                    format='%(asctime)s,%(msecs)d %(name)s %(levelname)s %(message)s',
-                    datefmt='%H:%M:%S',
-                    level=logging.INFO)
-
-    logger = logging.getLogger('scoreboard')
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.INFO)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    ch.setFormatter(formatter)
-    logger.addHandler(ch)
+    # A provider for each enabled league, in the order they're in the config. They take turns in the rotation.
+    providers = {}
+    for section in config.sections():
+        if (section in LEAGUES or config.has_option(section, 'sport')) and config.getboolean(section, 'enabled', fallback=False):
+            providers[section] = leagueProvider.fromConfig(config, section)
+
+    # Each league's worker fetches on its own, so there's a pooled connection for every league.
+    espn = httpClient(config.getfloat('scoreboard', 'httpConnectTimeout', fallback=3.05), config.getfloat('scoreboard', 'httpReadTimeout', fallback=10), max(4, len(providers)))
+
+    # Record every pull for replay.py when there's a log to record to.
+    feedLog = config.get('scoreboard', 'feedLog', fallback='')
+    recorder = feedRecorder(feedLog) if feedLog else None
+
+    tracker = gameTracker()
+
+    # Metrics are served on localhost for Prometheus, and written to a stats file for boards that can't be scraped.
+    try:
+        exporter = metricsExporter(metrics, config.get('metrics', 'address', fallback='127.0.0.1'), config.getint('metrics', 'port', fallback=0),
+                                   config.get('metrics', 'statsFile', fallback=''), config.getint('metrics', 'statsInterval', fallback=60))
+        exporter.start()
+    except OSError as e:
+        logger.error('Error %s', 'starting the metrics server', exc_info=e)
+        exporter = None
+
+if __name__ == "__main__":
+    # Read in configs from INI
+    config = configparser.ConfigParser()
+    #config.read('setup/scoreboard.conf')
+    config.read('rgb_scoreboard.conf')
+
+    setupLogging(config)
     logger.info("Running Scoreboard")
 
+    setupScoreboard(config)
+
     # Run the scoreboard.
     runScoreboard()
     